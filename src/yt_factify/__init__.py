@@ -36,10 +36,12 @@ Output rendering::
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    pass
+    from yt_factify.pipeline import PipelineError as PipelineError
+    from yt_factify.pipeline import run_pipeline as run_pipeline
 
 __version__ = "0.6.1"
 
@@ -47,11 +49,24 @@ __version__ = "0.6.1"
 # Re-exports for public API
 from yt_factify.config import AppConfig as AppConfig
 from yt_factify.models import ExtractionResult as ExtractionResult
-from yt_factify.pipeline import PipelineError as PipelineError
-from yt_factify.pipeline import run_pipeline
 from yt_factify.rendering import render_json as render_json
 from yt_factify.rendering import render_markdown as render_markdown
 
+# The pipeline pulls in litellm, which dominates import time. Defer it until
+# one of its exports is first used so that importing lightweight submodules
+# such as ``yt_factify.models`` stays cheap.
+_LAZY_PIPELINE_EXPORTS = frozenset({"PipelineError", "run_pipeline"})
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_PIPELINE_EXPORTS:
+        from yt_factify import pipeline
+
+        value = getattr(pipeline, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 async def extract(
     video_id: str,
@@ -85,7 +100,9 @@ async def extract(
 
         config = load_config()
 
-    return await run_pipeline(video_id, config)
+    # Look up through the module so the lazy export is resolved on first use.
+    result: ExtractionResult = await sys.modules[__name__].run_pipeline(video_id, config)
+    return result
 
 
 def extract_sync(
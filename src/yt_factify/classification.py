@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 import structlog
 
 from yt_factify.config import AppConfig
-from yt_factify.llm import llm_completion
+from yt_factify.llm import llm_completion, strip_fences
 from yt_factify.models import (
     BeliefSystemModule,
     BiasProfile,
@@ -44,16 +44,6 @@ class CredibilityError(Exception):
     """Raised when credibility assessment fails after retries."""
 
 
-def _strip_fences(text: str) -> str:
-    """Strip markdown code fences from LLM response text."""
-    text = text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = lines[1:-1] if lines[-1].strip() == "```" else lines[1:]
-        text = "\n".join(lines)
-    return text
-
-
 def _parse_classification(raw_text: str) -> VideoClassification:
     """Parse LLM classification response into a VideoClassification.
 
@@ -67,7 +57,7 @@ def _parse_classification(raw_text: str) -> VideoClassification:
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the JSON doesn't match the expected schema.
     """
-    data = json.loads(_strip_fences(raw_text))
+    data = json.loads(strip_fences(raw_text))
     if not isinstance(data, dict):
         msg = f"Expected JSON object, got {type(data).__name__}"
         raise ValueError(msg)
@@ -116,7 +106,7 @@ def _parse_credibility_assessments(
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the JSON is not a list.
     """
-    data = json.loads(_strip_fences(raw_text))
+    data = json.loads(strip_fences(raw_text))
     if not isinstance(data, list):
         msg = f"Expected JSON array, got {type(data).__name__}"
         raise ValueError(msg)
@@ -151,7 +151,13 @@ def extract(video: str, **kwargs: Any) -> None:
 
     # Run the pipeline
     from yt_factify.pipeline import PipelineError, run_pipeline
-    from yt_factify.rendering import render_json, render_markdown, write_output
+    from yt_factify.rendering import (
+        render_json,
+        render_json_bytes,
+        render_markdown,
+        write_markdown_output,
+        write_output,
+    )
     from yt_factify.transcript import EmptyTranscriptError, TranscriptFetchError
 
     try:
@@ -171,18 +177,18 @@ def extract(video: str, **kwargs: Any) -> None:
         click.echo(f"Error: {exc}", err=True)
         sys.exit(EXIT_GENERAL)
 
-    # Render output
+    # Render to file (streamed / as bytes) or stdout
     fmt = config.output_format
-    output = render_markdown(result) if fmt == "markdown" else render_json(result)
-
-    # Write to file or stdout
     if config.output_path:
         out = _resolve_output_path(config.output_path, video_id, fmt)
         out.parent.mkdir(parents=True, exist_ok=True)
-        write_output(output, out)
+        if fmt == "markdown":
+            write_markdown_output(result, out)
+        else:
+            write_output(render_json_bytes(result), out)
         click.echo(f"Output written to {out}")
     else:
-        click.echo(output)
+        click.echo(render_markdown(result) if fmt == "markdown" else render_json(result))
 
 
 @cli.command()
@@ -207,7 +213,13 @@ def convert(input_file: str, output_format: str, output_path: str | None) -> Non
     from pydantic import ValidationError
 
     from yt_factify.models import ExtractionResult
-    from yt_factify.rendering import render_json, render_markdown, write_output
+    from yt_factify.rendering import (
+        render_json,
+        render_json_bytes,
+        render_markdown,
+        write_markdown_output,
+        write_output,
+    )
 
     input_path = Path(input_file)
     try:
@@ -222,16 +234,17 @@ def convert(input_file: str, output_format: str, output_path: str | None) -> Non
         click.echo(f"Error: invalid extraction JSON: {exc}", err=True)
         sys.exit(EXIT_VALIDATION)
 
-    output = render_markdown(result) if output_format == "markdown" else render_json(result)
-
     if output_path:
         video_id = result.video.video_id
         out = _resolve_output_path(output_path, video_id, output_format)
         out.parent.mkdir(parents=True, exist_ok=True)
-        write_output(output, out)
+        if output_format == "markdown":
+            write_markdown_output(result, out)
+        else:
+            write_output(render_json_bytes(result), out)
         click.echo(f"Output written to {out}")
     else:
-        click.echo(output)
+        click.echo(render_markdown(result) if output_format == "markdown" else render_json(result))
 
 
 def _resolve_output_path(
@@ -20,7 +20,7 @@ import tomllib
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from yt_factify.models import QuoteMismatchBehavior
 
@@ -30,6 +30,8 @@ DEFAULT_CONFIG_PATH = Path.home() / ".config" / "yt-factify" / "config.toml"
 class AppConfig(BaseModel):
     """Application configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     model: str = ""
     api_base: str | None = None
     api_key: str | None = None
@@ -10,13 +10,14 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import uuid
 from typing import TYPE_CHECKING
 
 import structlog
 
 from yt_factify.config import AppConfig
-from yt_factify.llm import llm_completion
+from yt_factify.llm import llm_completion, strip_fences
 from yt_factify.models import (
     BeliefSystemModule,
     ExtractedItem,
@@ -37,6 +38,10 @@ class ExtractionError(Exception):
     """Raised when LLM extraction fails after retries."""
 
 
+# A line holding only a batch position identifier, e.g. "[3]".
+_BATCH_MARKER_RE = re.compile(r"^\[(\d+)\][ \t]*$", re.MULTILINE)
+
+
 def _parse_items_from_response(
     raw_text: str,
     video_id: str,
@@ -56,15 +61,7 @@ def _parse_items_from_response(
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the JSON is not a list.
     """
-    # Strip markdown fences if the LLM included them
-    text = raw_text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last fence lines
-        lines = lines[1:-1] if lines[-1].strip() == "```" else lines[1:]
-        text = "\n".join(lines)
-
-    data = json.loads(text)
+    data = json.loads(strip_fences(raw_text))
     if not isinstance(data, list):
         msg = f"Expected JSON array, got {type(data).__name__}"
         raise ValueError(msg)
@@ -93,6 +90,56 @@ def _parse_items_from_response(
     return items
 
 
+def parse_batch_response(
+    raw_text: str,
+    video_id: str,
+    segments: list[TranscriptSegment],
+) -> list[list[ExtractedItem]]:
+    """Split a batched LLM response on ``[i]`` markers into per-segment items.
+
+    Args:
+        raw_text: Raw text from LLM response for a batch built by
+            ``build_extraction_messages_batch``.
+        video_id: Video ID for evidence anchoring.
+        segments: The segments of the batch, in prompt order.
+
+    Returns:
+        One list of validated ExtractedItem per segment, in segment order.
+        Segments the response does not mention yield an empty list; a
+        repeated marker adds its items to that segment's list.
+
+    Raises:
+        json.JSONDecodeError: If a segment's block is not valid JSON.
+        ValueError: If the response has no markers or a block is not a list.
+    """
+    text = strip_fences(raw_text)
+    markers = list(_BATCH_MARKER_RE.finditer(text))
+    if not markers:
+        msg = "Expected [i] segment markers in batched response"
+        raise ValueError(msg)
+
+    per_segment: list[list[ExtractedItem]] = [[] for _ in segments]
+    for marker, following in zip(markers, [*markers[1:], None], strict=True):
+        index = int(marker.group(1)) - 1
+        if not 0 <= index < len(segments):
+            logger.warning(
+                "skipping_unknown_batch_marker",
+                marker=marker.group(1),
+                video_id=video_id,
+            )
+            continue
+        block = text[marker.end() : following.start() if following else None]
+        if per_segment[index]:
+            logger.warning(
+                "duplicate_batch_marker",
+                marker=marker.group(1),
+                video_id=video_id,
+            )
+        per_segment[index].extend(_parse_items_from_response(block, video_id, segments[index]))
+
+    return per_segment
+
+
 async def _extract_segment(
     segment: TranscriptSegment,
     video_id: str,
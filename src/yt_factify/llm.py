@@ -4,7 +4,10 @@
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 
-"""Shared LLM call helper with rate-limit-aware retry and gentlify throttling."""
+"""Shared LLM call helper with rate-limit-aware retry and gentlify throttling.
+
+Also holds ``strip_fences()``, the response cleanup shared by every parser.
+"""
 
 from __future__ import annotations
 
@@ -18,6 +21,8 @@ import structlog
 from yt_factify.config import AppConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from gentlify import Throttle
 
 logger = structlog.get_logger()
@@ -54,6 +59,19 @@ def _parse_retry_after(exc: BaseException) -> float | None:
     return None
 
 
+def strip_fences(text: str) -> str:
+    """Strip surrounding markdown code fences from LLM response text."""
+    text = text.strip()
+    if text.startswith("```"):
+        # Drop the opening fence line, then the closing one if present,
+        # without splitting the whole body into lines.
+        _, _, text = text.partition("\n")
+        head, _, last = text.rpartition("\n")
+        if last.strip() == "```":
+            text = head
+    return text
+
+
 async def llm_completion(
     *,
     messages: list[dict[str, str]],
@@ -61,6 +79,7 @@ async def llm_completion(
     max_attempts: int = 2,
     context: str = "llm_call",
     throttle: Throttle | None = None,
+    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
 ) -> str:
     """Call litellm.acompletion with rate-limit-aware retry.
 
@@ -89,6 +108,8 @@ async def llm_completion(
         context: Label for log messages (e.g. ``"extraction"``).
         throttle: Optional shared :class:`gentlify.Throttle` for adaptive
             rate coordination.
+        sleep: Coroutine function used to wait out rate-limit backoff.
+            Defaults to :func:`asyncio.sleep`; tests can inject a no-op.
 
     Returns:
         The text content of the first choice.
@@ -156,7 +177,7 @@ async def llm_completion(
                     rate_limit_retry=rate_limit_retries,
                     error=str(exc),
                 )
-                await asyncio.sleep(delay)
+                await sleep(delay)
                 continue  # don't count against max_attempts
 
             # Non-rate-limit error
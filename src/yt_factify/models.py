@@ -11,7 +11,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ---------------------------------------------------------------------------
 # Core Enums
@@ -90,6 +90,8 @@ class RawTranscript(BaseModel):
 class NormalizedSegment(BaseModel):
     """A normalized transcript segment with hash."""
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     start_ms: int
     end_ms: int
@@ -99,6 +101,8 @@ class NormalizedSegment(BaseModel):
 class NormalizedTranscript(BaseModel):
     """Normalized transcript with full-text hash."""
 
+    model_config = ConfigDict(frozen=True)
+
     video_id: str
     full_text: str
     hash: str  # SHA-256 of full normalized text
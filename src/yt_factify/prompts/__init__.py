@@ -8,11 +8,52 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from yt_factify.models import BeliefSystemModule
 
 # Message type used by litellm: list of {"role": ..., "content": ...} dicts.
 type ChatMessage = dict[str, str]
 
+# Hashable stand-in for a BeliefSystemModule, used to key cached system prompts:
+# (label, display_name, description, core_assumptions).
+type BeliefModuleKey = tuple[str, str, str, tuple[str, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class PromptParts:
+    """A prompt split into a shared system preamble and a per-call user message.
+
+    ``shared`` holds the system prompt as a tuple of parts that are module
+    constants or cached renders, so many prompts built from the same context
+    reference one copy of the preamble instead of each owning its own
+    concatenated string.
+    """
+
+    shared: tuple[str, ...]
+    per_call: str
+
+    @property
+    def system(self) -> str:
+        """The shared parts joined into one system prompt (cached per tuple)."""
+        return _join_parts(self.shared)
+
+    def to_messages(self) -> list[ChatMessage]:
+        """Materialize the (system, user) messages for litellm.completion()."""
+        return [_system_msg(self.system), _user_msg(self.per_call)]
+
+
+@functools.lru_cache(maxsize=64)
+def _join_parts(parts: tuple[str, ...]) -> str:
+    """Join shared prompt parts, returning the same string for equal tuples."""
+    return "".join(parts)
+
 
 def hash_prompts(*prompt_texts: str) -> str:
     """Compute SHA-256 of concatenated prompt templates for audit trail.
@@ -27,6 +68,51 @@ def hash_prompts(*prompt_texts: str) -> str:
     return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
 
+def hash_prompts_batch(prefix: str, tails: Iterable[str]) -> list[str]:
+    """Hash many prompts that share a common leading template.
+
+    Equivalent to ``[hash_prompts(prefix, tail) for tail in tails]``, but the
+    prefix is hashed once and its digest state copied for each tail.
+
+    Args:
+        prefix: The shared prompt text (e.g. a system prompt).
+        tails: Per-prompt texts that follow the prefix.
+
+    Returns:
+        Hex-encoded SHA-256 digests, one per tail, in order.
+    """
+    base = hashlib.sha256(f"{prefix}\n---\n".encode())
+    digests: list[str] = []
+    for tail in tails:
+        h = base.copy()
+        h.update(tail.encode("utf-8"))
+        digests.append(h.hexdigest())
+    return digests
+
+
+def _belief_module_key(module: BeliefSystemModule) -> BeliefModuleKey:
+    """Reduce a belief module to the hashable fields rendered into prompts."""
+    return (
+        module.label,
+        module.display_name,
+        module.description,
+        tuple(module.core_assumptions),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _format_belief_module(module: BeliefModuleKey) -> str:
+    """Format a single belief system module for inclusion in a prompt.
+
+    Shared by the extraction and credibility prompts and cached, so each
+    module is rendered once however many prompt contexts include it.
+    """
+    label, display_name, description, core_assumptions = module
+    assumptions = "\n".join(f"  - {a}" for a in core_assumptions)
+    header = f"- **{display_name}** ({label}): {description}"
+    return f"{header}\n  Core assumptions:\n{assumptions}"
+
+
 def _system_msg(content: str) -> ChatMessage:
     """Create a system message dict."""
     return {"role": "system", "content": content}
@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from yt_factify.models import NormalizedTranscript, VideoCategory
 from yt_factify.prompts import ChatMessage, _system_msg, _user_msg
 
@@ -38,6 +40,9 @@ Return a JSON object with:
 Return ONLY the JSON object. No commentary, no markdown fences.\
 """
 
+# Every VideoCategory value as a Markdown list, rendered once at import.
+_CATEGORIES_BLOCK = "\n".join(f"- `{c.value}`" for c in VideoCategory)
+
 BIAS_SYSTEM_PROMPT = """\
 You are a media bias analyst. Given a transcript excerpt and the video's \
 category, assess the bias and slant of the content.
@@ -65,9 +70,10 @@ Return ONLY the JSON object. No commentary, no markdown fences.\
 """
 
 
-def _format_categories() -> str:
-    """Format all VideoCategory values for inclusion in a prompt."""
-    return "\n".join(f"- `{c.value}`" for c in VideoCategory)
+@functools.cache
+def _render_system() -> str:
+    """Render the classification system prompt once; it has no per-call inputs."""
+    return CLASSIFICATION_SYSTEM_PROMPT.format(categories=_CATEGORIES_BLOCK)
 
 
 def _sample_transcript(transcript: NormalizedTranscript, max_chars: int = 8000) -> str:
@@ -112,7 +118,7 @@ def build_classification_messages(
     Returns:
         A list of message dicts (system, user) suitable for litellm.completion().
     """
-    system = CLASSIFICATION_SYSTEM_PROMPT.format(categories=_format_categories())
+    system = _render_system()
 
     sample = _sample_transcript(transcript)
     user_content = f"Video ID: {transcript.video_id}\n\nTranscript:\n{sample}"
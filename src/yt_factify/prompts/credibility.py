@@ -8,8 +8,17 @@
 
 from __future__ import annotations
 
+import functools
+
 from yt_factify.models import BeliefSystemModule, ExtractedItem
-from yt_factify.prompts import ChatMessage, _system_msg, _user_msg
+from yt_factify.prompts import (
+    BeliefModuleKey,
+    ChatMessage,
+    _belief_module_key,
+    _format_belief_module,
+    _system_msg,
+    _user_msg,
+)
 
 CREDIBILITY_SYSTEM_PROMPT = """\
 You are a credibility analyst. Given a list of extracted items from a YouTube \
@@ -69,13 +78,16 @@ value depends on assumptions from one of these systems, note it in \
 """
 
 
-def _format_belief_module(module: BeliefSystemModule) -> str:
-    """Format a single belief system module for inclusion in a prompt."""
-    assumptions = "\n".join(f"  - {a}" for a in module.core_assumptions)
-    return (
-        f"- **{module.display_name}** ({module.label}): "
-        f"{module.description}\n  Core assumptions:\n{assumptions}"
-    )
+@functools.lru_cache(maxsize=64)
+def _render_system(belief_modules: tuple[BeliefModuleKey, ...]) -> str:
+    """Render the credibility system prompt; cached per set of belief modules."""
+    system = CREDIBILITY_SYSTEM_PROMPT
+
+    if belief_modules:
+        modules_str = "\n\n".join(_format_belief_module(m) for m in belief_modules)
+        system += _BELIEF_SYSTEMS_SECTION.format(modules=modules_str)
+
+    return system
 
 
 def _format_item_for_prompt(item: ExtractedItem) -> str:
@@ -102,11 +114,7 @@ def build_credibility_messages(
     Returns:
         A list of message dicts (system, user) suitable for litellm.completion().
     """
-    system = CREDIBILITY_SYSTEM_PROMPT
-
-    if belief_modules:
-        modules_str = "\n\n".join(_format_belief_module(m) for m in belief_modules)
-        system += _BELIEF_SYSTEMS_SECTION.format(modules=modules_str)
+    system = _render_system(tuple(_belief_module_key(m) for m in belief_modules or ()))
 
     items_str = "\n\n".join(_format_item_for_prompt(item) for item in items)
     user_content = f"Assess the credibility of these extracted items:\n\n{items_str}"
@@ -8,8 +8,16 @@
 
 from __future__ import annotations
 
+import functools
+
 from yt_factify.models import BeliefSystemModule, TranscriptSegment, VideoCategory
-from yt_factify.prompts import ChatMessage, _system_msg, _user_msg
+from yt_factify.prompts import (
+    BeliefModuleKey,
+    ChatMessage,
+    PromptParts,
+    _belief_module_key,
+    _format_belief_module,
+)
 
 EXTRACTION_SYSTEM_PROMPT = """\
 You are a precise fact-extraction engine. Your job is to extract structured \
@@ -75,12 +83,77 @@ that rely on assumptions from these worldviews:
 {modules}\
 """
 
+_BATCH_SECTION = """\
+
+## Batched Segments
+
+The user message contains several transcript segments, each introduced by a \
+bracketed position identifier such as `[1]`. Anchor every item to the \
+segment it came from. For each segment, output its position identifier on a \
+line of its own followed by that segment's JSON array, in order. Use `[]` \
+for segments with no items.\
+"""
+
+DEFAULT_BATCH_SIZE = 8
+
+
+@functools.lru_cache(maxsize=64)
+def _render_system(
+    categories: tuple[VideoCategory, ...],
+    belief_modules: tuple[BeliefModuleKey, ...],
+) -> tuple[str, ...]:
+    """Render the extraction system prompt parts; cached per categories/modules pair."""
+    parts = [EXTRACTION_SYSTEM_PROMPT]
+
+    if categories:
+        cat_str = ", ".join(c.value for c in categories)
+        parts.append(_CATEGORIES_SECTION.format(categories=cat_str))
+
+    if belief_modules:
+        modules_str = "\n\n".join(_format_belief_module(m) for m in belief_modules)
+        parts.append(_BELIEF_SYSTEMS_SECTION.format(modules=modules_str))
+
+    return tuple(parts)
+
+
+def _build_extraction_system(
+    categories: list[VideoCategory] | None,
+    belief_modules: list[BeliefSystemModule] | None,
+) -> tuple[str, ...]:
+    """Return the shared extraction system prompt parts for the given context."""
+    return _render_system(
+        tuple(categories or ()),
+        tuple(_belief_module_key(m) for m in belief_modules or ()),
+    )
+
+
+def build_extraction_prompt_parts(
+    segment: TranscriptSegment,
+    video_id: str,
+    categories: list[VideoCategory] | None = None,
+    belief_modules: list[BeliefSystemModule] | None = None,
+) -> PromptParts:
+    """Build the extraction prompt as a shared preamble plus a per-segment message.
+
+    Prompts built with the same categories and belief modules share the same
+    ``shared`` tuple, so holding one per segment costs only the user message.
+
+    Args:
+        segment: Transcript segment to extract items from.
+        video_id: YouTube video ID for evidence anchoring.
+        categories: Optional video categories for context.
+        belief_modules: Optional belief system modules for flagging.
+
+    Returns:
+        The prompt parts; call ``to_messages()`` to get litellm messages.
+    """
+    user_content = (
+        f"Video ID: {video_id}\n"
+        f"Segment time range: {segment.start_ms}ms – {segment.end_ms}ms\n\n"
+        f"Transcript:\n{segment.text}"
+    )
 
-def _format_belief_module(module: BeliefSystemModule) -> str:
-    """Format a single belief system module for inclusion in a prompt."""
-    assumptions = "\n".join(f"  - {a}" for a in module.core_assumptions)
-    header = f"- **{module.display_name}** ({module.label}): {module.description}"
-    return f"{header}\n  Core assumptions:\n{assumptions}"
+    return PromptParts(_build_extraction_system(categories, belief_modules), user_content)
 
 
 def build_extraction_messages(
@@ -100,20 +173,52 @@ def build_extraction_messages(
     Returns:
         A list of message dicts (system, user) suitable for litellm.completion().
     """
-    system = EXTRACTION_SYSTEM_PROMPT
+    return build_extraction_prompt_parts(
+        segment, video_id, categories, belief_modules
+    ).to_messages()
 
-    if categories:
-        cat_str = ", ".join(c.value for c in categories)
-        system += _CATEGORIES_SECTION.format(categories=cat_str)
 
-    if belief_modules:
-        modules_str = "\n\n".join(_format_belief_module(m) for m in belief_modules)
-        system += _BELIEF_SYSTEMS_SECTION.format(modules=modules_str)
+def build_extraction_messages_batch(
+    segments: list[TranscriptSegment],
+    video_id: str,
+    categories: list[VideoCategory] | None = None,
+    belief_modules: list[BeliefSystemModule] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[list[ChatMessage]]:
+    """Build batched chat messages that extract items from several segments per call.
 
-    user_content = (
-        f"Video ID: {video_id}\n"
-        f"Segment time range: {segment.start_ms}ms – {segment.end_ms}ms\n\n"
-        f"Transcript:\n{segment.text}"
-    )
+    The system prompt is rendered once and shared by every batch. Each
+    batch's user message lists up to ``batch_size`` segments, prefixed with
+    ``[1]``, ``[2]``, ... position identifiers that the model echoes back.
+    Decode each reply with ``yt_factify.extraction.parse_batch_response``.
+
+    Args:
+        segments: Transcript segments to extract items from.
+        video_id: YouTube video ID for evidence anchoring.
+        categories: Optional video categories for context.
+        belief_modules: Optional belief system modules for flagging.
+        batch_size: Maximum number of segments per request.
 
-    return [_system_msg(system), _user_msg(user_content)]
+    Returns:
+        One message list (system, user) per batch, in segment order.
+
+    Raises:
+        ValueError: If ``batch_size`` is less than 1.
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be at least 1, got {batch_size}"
+        raise ValueError(msg)
+
+    shared = (*_build_extraction_system(categories, belief_modules), _BATCH_SECTION)
+
+    batches: list[list[ChatMessage]] = []
+    for offset in range(0, len(segments), batch_size):
+        batch = segments[offset : offset + batch_size]
+        user_content = "".join(
+            f"[{i}] video_id={video_id} start_ms={seg.start_ms} "
+            f"end_ms={seg.end_ms} text={seg.text}\n"
+            for i, seg in enumerate(batch, start=1)
+        )
+        batches.append(PromptParts(shared, user_content).to_messages())
+
+    return batches
@@ -12,8 +12,10 @@ import contextlib
 import os
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
 import structlog
+from pydantic import TypeAdapter
 
 from yt_factify.models import (
     ExtractedItem,
@@ -22,6 +24,9 @@ from yt_factify.models import (
     TopicThread,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 logger = structlog.get_logger()
 
 
@@ -30,6 +35,26 @@ logger = structlog.get_logger()
 # ---------------------------------------------------------------------------
 
 
+# Built once so every call reuses the same compiled serializer.
+_RESULT_ADAPTER: TypeAdapter[ExtractionResult] = TypeAdapter(ExtractionResult)
+
+
+def render_json_bytes(result: ExtractionResult, *, indent: int = 2) -> bytes:
+    """Serialize an ExtractionResult to UTF-8 encoded JSON.
+
+    Suitable for passing straight to ``write_output()`` without a
+    decode/encode round trip.
+
+    Args:
+        result: The pipeline output to serialize.
+        indent: JSON indentation level.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    return _RESULT_ADAPTER.dump_json(result, indent=indent)
+
+
 def render_json(result: ExtractionResult, *, indent: int = 2) -> str:
     """Serialize an ExtractionResult to a JSON string.
 
@@ -40,7 +65,7 @@ def render_json(result: ExtractionResult, *, indent: int = 2) -> str:
     Returns:
         JSON string representation.
     """
-    return result.model_dump_json(indent=indent)
+    return render_json_bytes(result, indent=indent).decode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -50,59 +75,58 @@ def render_json(result: ExtractionResult, *, indent: int = 2) -> str:
 
 def _format_ms(ms: int) -> str:
     """Format milliseconds as HH:MM:SS or MM:SS."""
-    total_seconds = ms // 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    minutes, seconds = divmod(ms // 1000, 60)
+    hours, minutes = divmod(minutes, 60)
     if hours > 0:
         return f"{hours}:{minutes:02d}:{seconds:02d}"
     return f"{minutes}:{seconds:02d}"
 
 
-def _render_video_info(result: ExtractionResult) -> str:
-    """Render the Video Info section."""
-    lines = ["## Video Info", ""]
-    lines.append(f"- **Video ID:** {result.video.video_id}")
+def _render_video_info(result: ExtractionResult) -> Iterator[str]:
+    """Render the Video Info section line by line."""
+    yield "## Video Info"
+    yield ""
+    yield f"- **Video ID:** {result.video.video_id}"
     if result.video.title:
-        lines.append(f"- **Title:** {result.video.title}")
-    lines.append(f"- **URL:** {result.video.url}")
+        yield f"- **Title:** {result.video.title}"
+    yield f"- **URL:** {result.video.url}"
     cats = ", ".join(c.value for c in result.classification.categories)
-    lines.append(f"- **Categories:** {cats}")
+    yield f"- **Categories:** {cats}"
     bp = result.classification.bias_profile
-    lines.append(f"- **Bias:** {bp.primary_label} (confidence: {bp.confidence:.0%})")
+    yield f"- **Bias:** {bp.primary_label} (confidence: {bp.confidence:.0%})"
     if bp.rationale:
-        lines.append(f"- **Bias Rationale:** {bp.rationale}")
-    return "\n".join(lines)
+        yield f"- **Bias Rationale:** {bp.rationale}"
 
 
-def _render_topic_overview(threads: list[TopicThread]) -> str:
-    """Render the Topic Overview section."""
+def _render_topic_overview(threads: list[TopicThread]) -> Iterator[str]:
+    """Render the Topic Overview section line by line (nothing if no threads)."""
     if not threads:
-        return ""
-    lines = ["## Topic Overview", ""]
+        return
+    yield "## Topic Overview"
+    yield ""
     for thread in threads:
         timeline_str = ", ".join(
             f"{_format_ms(span.start_ms)}–{_format_ms(span.end_ms)}" for span in thread.timeline
         )
-        lines.append(f"### {thread.display_name}")
-        lines.append("")
-        lines.append(f"{thread.summary}")
-        lines.append("")
+        yield f"### {thread.display_name}"
+        yield ""
+        yield f"{thread.summary}"
+        yield ""
         if timeline_str:
-            lines.append(f"- **Timeline:** {timeline_str}")
-        lines.append(f"- **Items:** {len(thread.item_ids)}")
-        lines.append("")
-    return "\n".join(lines)
+            yield f"- **Timeline:** {timeline_str}"
+        yield f"- **Items:** {len(thread.item_ids)}"
+        yield ""
 
 
 def _render_items_section(
     title: str,
     items: list[ExtractedItem],
-) -> str:
-    """Render a section of extracted items."""
+) -> Iterator[str]:
+    """Render a section of extracted items line by line (nothing if empty)."""
     if not items:
-        return ""
-    lines = [f"## {title}", ""]
+        return
+    yield f"## {title}"
+    yield ""
     for item in items:
         time_range = (
             f"{_format_ms(item.transcript_evidence.start_ms)}–"
@@ -111,64 +135,46 @@ def _render_items_section(
         speaker = f" ({item.speaker})" if item.speaker else ""
 
         if item.type == ItemType.DIRECT_QUOTE:
-            lines.append(f'> "{item.content}"{speaker}')
+            yield f'> "{item.content}"{speaker}'
         else:
-            lines.append(f"- {item.content}{speaker}")
+            yield f"- {item.content}{speaker}"
 
-        lines.append(f"  *[{time_range}]*")
+        yield f"  *[{time_range}]*"
 
         if item.credibility:
             cred = item.credibility
-            lines.append(f"  Credibility: **{cred.label.value}** ({cred.confidence:.0%})")
+            yield f"  Credibility: **{cred.label.value}** ({cred.confidence:.0%})"
 
         if item.belief_system_flags:
             flags = ", ".join(f"{f.module_label}: {f.note}" for f in item.belief_system_flags)
-            lines.append(f"  Belief systems: {flags}")
+            yield f"  Belief systems: {flags}"
 
-        lines.append("")
-    return "\n".join(lines)
+        yield ""
 
 
-def _render_belief_system_notes(result: ExtractionResult) -> str:
-    """Render the Belief System Notes section."""
-    flagged = [item for item in result.items if item.belief_system_flags]
+def _render_belief_system_notes(flagged: list[ExtractedItem]) -> Iterator[str]:
+    """Render the Belief System Notes section line by line (nothing if no flags)."""
     if not flagged:
-        return ""
-    lines = ["## Belief System Notes", ""]
-    lines.append("The following items were flagged as relying on specific worldview assumptions:")
-    lines.append("")
+        return
+    yield "## Belief System Notes"
+    yield ""
+    yield "The following items were flagged as relying on specific worldview assumptions:"
+    yield ""
     for item in flagged:
         for flag in item.belief_system_flags:
-            lines.append(f"- **{flag.module_label}:** {flag.note} (item: {item.id})")
-    lines.append("")
-    return "\n".join(lines)
-
+            yield f"- **{flag.module_label}:** {flag.note} (item: {item.id})"
+    yield ""
 
-def render_markdown(result: ExtractionResult) -> str:
-    """Render an ExtractionResult as a human-readable Markdown summary.
 
-    Sections:
-        - Video Info
-        - Topic Overview
-        - Key Facts
-        - Direct Quotes
-        - Opinions & Perspectives
-        - Unverified Claims
-        - Predictions
-        - Belief System Notes
-
-    Args:
-        result: The pipeline output to render.
-
-    Returns:
-        Markdown string.
-    """
-    # Group items by type
+def _markdown_lines(result: ExtractionResult) -> Iterator[str]:
+    """Yield every line of the Markdown report, section by section."""
+    # Group items by type, collecting belief-flagged items in the same pass
     facts: list[ExtractedItem] = []
     quotes: list[ExtractedItem] = []
     opinions: list[ExtractedItem] = []
     unverified: list[ExtractedItem] = []
     predictions: list[ExtractedItem] = []
+    flagged: list[ExtractedItem] = []
 
     for item in result.items:
         match item.type:
@@ -182,23 +188,40 @@ def render_markdown(result: ExtractionResult) -> str:
                 unverified.append(item)
             case ItemType.PREDICTION:
                 predictions.append(item)
+        if item.belief_system_flags:
+            flagged.append(item)
+
+    yield f"# yt-factify Report: {result.video.video_id}"
+    yield from _render_video_info(result)
+    yield from _render_topic_overview(result.topic_threads)
+    yield from _render_items_section("Key Facts", facts)
+    yield from _render_items_section("Direct Quotes", quotes)
+    yield from _render_items_section("Opinions & Perspectives", opinions)
+    yield from _render_items_section("Unverified Claims", unverified)
+    yield from _render_items_section("Predictions", predictions)
+    yield from _render_belief_system_notes(flagged)
+
+
+def render_markdown(result: ExtractionResult) -> str:
+    """Render an ExtractionResult as a human-readable Markdown summary.
+
+    Sections:
+        - Video Info
+        - Topic Overview
+        - Key Facts
+        - Direct Quotes
+        - Opinions & Perspectives
+        - Unverified Claims
+        - Predictions
+        - Belief System Notes
+
+    Args:
+        result: The pipeline output to render.
 
-    sections = [
-        f"# yt-factify Report: {result.video.video_id}",
-        "",
-        _render_video_info(result),
-        "",
-        _render_topic_overview(result.topic_threads),
-        _render_items_section("Key Facts", facts),
-        _render_items_section("Direct Quotes", quotes),
-        _render_items_section("Opinions & Perspectives", opinions),
-        _render_items_section("Unverified Claims", unverified),
-        _render_items_section("Predictions", predictions),
-        _render_belief_system_notes(result),
-    ]
-
-    # Filter empty sections and join
-    content = "\n".join(s for s in sections if s)
+    Returns:
+        Markdown string.
+    """
+    content = "\n".join(_markdown_lines(result))
 
     # Ensure trailing newline
     if not content.endswith("\n"):
@@ -207,22 +230,35 @@ def render_markdown(result: ExtractionResult) -> str:
     return content
 
 
+def render_markdown_to(result: ExtractionResult, writer: BinaryIO) -> None:
+    """Stream the Markdown summary to a binary file object as UTF-8.
+
+    Writes the same bytes as ``render_markdown(result).encode()`` one line
+    at a time, so the document is never held in memory as a whole.
+
+    Args:
+        result: The pipeline output to render.
+        writer: Binary file object to write to (e.g. opened ``"wb"``).
+    """
+    last = ""
+    for i, line in enumerate(_markdown_lines(result)):
+        if i:
+            writer.write(b"\n")
+        writer.write(line.encode())
+        last = line
+    # Mirror render_markdown's trailing-newline rule: an empty last line
+    # means the document already ends with the separator just written.
+    if last and not last.endswith("\n"):
+        writer.write(b"\n")
+
+
 # ---------------------------------------------------------------------------
 # Atomic file writing
 # ---------------------------------------------------------------------------
 
 
-def write_output(content: str, output_path: Path) -> None:
-    """Write content to a file atomically.
-
-    Writes to a temporary file in the same directory, then renames
-    to the target path. This ensures the output file is never in a
-    partial state.
-
-    Args:
-        content: String content to write.
-        output_path: Destination file path.
-    """
+def _write_atomic(output_path: Path, emit: Callable[[BinaryIO], object]) -> None:
+    """Run ``emit`` against a temp file, fsync it, then rename into place."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     fd, tmp_path = tempfile.mkstemp(
@@ -230,8 +266,10 @@ def write_output(content: str, output_path: Path) -> None:
         suffix=".tmp",
     )
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        with os.fdopen(fd, "wb") as f:
+            emit(f)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp_path, output_path)
         logger.info("output_written", path=str(output_path))
     except BaseException:
@@ -239,3 +277,58 @@ def write_output(content: str, output_path: Path) -> None:
         with contextlib.suppress(OSError):
             os.unlink(tmp_path)
         raise
+
+
+def write_output(content: str | bytes, output_path: Path) -> None:
+    """Write content to a file atomically.
+
+    Writes to a temporary file in the same directory, fsyncs it, then
+    renames to the target path. This ensures the output file is never in a
+    partial state.
+
+    Args:
+        content: Content to write; ``str`` is encoded to UTF-8 once,
+            ``bytes`` are written as-is.
+        output_path: Destination file path.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    _write_atomic(output_path, lambda f: f.write(data))
+
+
+def write_markdown_output(result: ExtractionResult, output_path: Path) -> None:
+    """Render a result's Markdown summary straight into a file, atomically.
+
+    Equivalent to ``write_output(render_markdown(result), output_path)``
+    but streams through ``render_markdown_to()``.
+
+    Args:
+        result: The pipeline output to render.
+        output_path: Destination file path.
+    """
+    _write_atomic(output_path, lambda f: render_markdown_to(result, f))
+
+
+def render_many(results: Iterable[ExtractionResult], output_path: Path) -> None:
+    """Append results to a JSON Lines file, one compact result per line.
+
+    All results go through a single file handle and a single fsync, rather
+    than one temp file, fsync and rename per result as with
+    ``write_output()``. Lines are appended, so an interrupted run leaves the
+    already-written results intact.
+
+    Args:
+        results: Pipeline outputs to serialize.
+        output_path: Destination ``.jsonl`` file; created if missing.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with output_path.open("ab") as f:
+        for result in results:
+            f.write(_RESULT_ADAPTER.dump_json(result))
+            f.write(b"\n")
+            count += 1
+        f.flush()
+        os.fsync(f.fileno())
+
+    logger.info("output_written", path=str(output_path), result_count=count)
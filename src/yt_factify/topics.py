@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 import structlog
 
 from yt_factify.config import AppConfig
-from yt_factify.llm import llm_completion
+from yt_factify.llm import llm_completion, strip_fences
 from yt_factify.models import (
     ExtractedItem,
     TopicThread,
@@ -34,16 +34,6 @@ class TopicClusteringError(Exception):
     """Raised when topic thread clustering fails after retries."""
 
 
-def _strip_fences(text: str) -> str:
-    """Strip markdown code fences from LLM response text."""
-    text = text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = lines[1:-1] if lines[-1].strip() == "```" else lines[1:]
-        text = "\n".join(lines)
-    return text
-
-
 def _derive_timeline(
     item_ids: list[str],
     items_by_id: dict[str, ExtractedItem],
@@ -70,19 +60,20 @@ def _derive_timeline(
     if not spans:
         return []
 
-    # Sort by start time
+    # Sort by start time, then sweep once keeping the open span in locals
     spans.sort()
-
-    # Merge overlapping spans
-    merged: list[tuple[int, int]] = [spans[0]]
-    for start, end in spans[1:]:
-        prev_start, prev_end = merged[-1]
-        if start <= prev_end:
-            merged[-1] = (prev_start, max(prev_end, end))
+    timeline: list[TopicTimeSpan] = []
+    cur_start, cur_end = spans[0]
+    for start, end in spans:
+        if start <= cur_end:
+            if end > cur_end:
+                cur_end = end
         else:
-            merged.append((start, end))
+            timeline.append(TopicTimeSpan(start_ms=cur_start, end_ms=cur_end))
+            cur_start, cur_end = start, end
+    timeline.append(TopicTimeSpan(start_ms=cur_start, end_ms=cur_end))
 
-    return [TopicTimeSpan(start_ms=s, end_ms=e) for s, e in merged]
+    return timeline
 
 
 def _parse_topic_threads(
@@ -103,7 +94,7 @@ def _parse_topic_threads(
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the JSON is not a list.
     """
-    data = json.loads(_strip_fences(raw_text))
+    data = json.loads(strip_fences(raw_text))
     if not isinstance(data, list):
         msg = f"Expected JSON array, got {type(data).__name__}"
         raise ValueError(msg)
@@ -13,6 +13,7 @@ import re
 import time
 import unicodedata
 from datetime import date
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -26,6 +27,9 @@ from yt_factify.models import (
     VideoMetadata,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = structlog.get_logger()
 
 
@@ -49,29 +53,38 @@ def _normalize_text(text: str) -> str:
     return text.strip()
 
 
-def _upload_date_hint(metadata: VideoMetadata | None) -> str:
-    """Return a human-readable hint based on video upload date."""
+_HINT_NO_CAPTIONS = "The video may lack captions or they may be disabled."
+_HINT_UPLOADED_TODAY = (
+    "This video was uploaded within the last 24 hours — "
+    "captions may not be available yet. Try again later."
+)
+_HINT_UPLOADED_RECENTLY = (
+    "This video was uploaded recently — auto-generated captions may still be processing."
+)
+
+
+def _upload_date_hint(metadata: VideoMetadata | None, today: date | None = None) -> str:
+    """Return a human-readable hint based on video upload date.
+
+    *today* defaults to :meth:`date.today`; pass a fixed date to make the
+    hint deterministic.
+    """
     if metadata is None or metadata.upload_date is None:
-        return "The video may lack captions or they may be disabled."
+        return _HINT_NO_CAPTIONS
 
     try:
         upload = date.fromisoformat(metadata.upload_date)
     except ValueError:
-        return "The video may lack captions or they may be disabled."
+        return _HINT_NO_CAPTIONS
 
-    age_days = (date.today() - upload).days
+    age_days = ((today or date.today()) - upload).days
 
     if age_days < 1:
-        return (
-            "This video was uploaded within the last 24 hours — "
-            "captions may not be available yet. Try again later."
-        )
+        return _HINT_UPLOADED_TODAY
     elif age_days <= 7:
-        return (
-            "This video was uploaded recently — auto-generated captions may still be processing."
-        )
+        return _HINT_UPLOADED_RECENTLY
     else:
-        return "The video may lack captions or they may be disabled."
+        return _HINT_NO_CAPTIONS
 
 
 def _build_video_metadata(result: object) -> VideoMetadata | None:
@@ -89,7 +102,13 @@ def _build_video_metadata(result: object) -> VideoMetadata | None:
     )
 
 
-def fetch_transcript(video_id: str, config: AppConfig) -> RawTranscript:
+def fetch_transcript(
+    video_id: str,
+    config: AppConfig,
+    *,
+    yt_fetch: Any = None,
+    sleep: Callable[[float], object] = time.sleep,
+) -> RawTranscript:
     """Fetch transcript via yt-fetch and return raw data.
 
     Calls ``yt_fetch.fetch_video()`` to retrieve transcript segments
@@ -98,6 +117,11 @@ def fetch_transcript(video_id: str, config: AppConfig) -> RawTranscript:
     Args:
         video_id: YouTube video ID.
         config: Application configuration.
+        yt_fetch: Object providing ``FetchOptions`` and ``fetch_video``.
+            Defaults to the installed ``yt_fetch`` module; tests can pass
+            a fake instead of patching ``sys.modules``.
+        sleep: Function used to wait between fetch attempts.  Defaults
+            to :func:`time.sleep`; tests can inject a no-op.
 
     Returns:
         A ``RawTranscript`` with raw segment data and optional metadata.
@@ -105,14 +129,16 @@ def fetch_transcript(video_id: str, config: AppConfig) -> RawTranscript:
     Raises:
         TranscriptFetchError: If the video or transcript is unavailable.
     """
-    try:
-        from yt_fetch import FetchOptions, fetch_video
-    except ImportError as exc:
-        raise TranscriptFetchError(
-            "yt-fetch is not installed. Install with: pip install yt-fetch"
-        ) from exc
-
-    opts = FetchOptions(
+    if yt_fetch is None:
+        try:
+            import yt_fetch as yt_fetch_module
+        except ImportError as exc:
+            raise TranscriptFetchError(
+                "yt-fetch is not installed. Install with: pip install yt-fetch"
+            ) from exc
+        yt_fetch = yt_fetch_module
+
+    opts = yt_fetch.FetchOptions(
         languages=config.languages,
         allow_generated=True,
         download="none",
@@ -127,7 +153,7 @@ def fetch_transcript(video_id: str, config: AppConfig) -> RawTranscript:
     retry_delay = 5.0
 
     for attempt in range(1, max_fetch_attempts + 1):
-        result = fetch_video(video_id, opts)
+        result = yt_fetch.fetch_video(video_id, opts)
         video_metadata = _build_video_metadata(result)
 
         # Hard failure with explicit errors — don't retry
@@ -149,7 +175,7 @@ def fetch_transcript(video_id: str, config: AppConfig) -> RawTranscript:
                 retry_in_seconds=retry_delay,
                 reason="no transcript returned — may be a transient YouTube block",
             )
-            time.sleep(retry_delay)
+            sleep(retry_delay)
             continue
 
         # Final attempt still failed
@@ -8,6 +8,11 @@
 
 from __future__ import annotations
 
+import functools
+from bisect import bisect_left, bisect_right
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
 import structlog
 
 from yt_factify.config import AppConfig
@@ -19,6 +24,9 @@ from yt_factify.models import (
     ValidationResult,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
 logger = structlog.get_logger()
 
 
@@ -56,6 +64,69 @@ def verify_quote(
     return quote_text in combined
 
 
+def _window_lookup(transcript: NormalizedTranscript) -> Callable[[int, int], str | None]:
+    """Build a cached ``(start_ms, end_ms) -> combined text`` lookup.
+
+    The returned function joins the text of the segments overlapping
+    the range exactly as :func:`verify_quote` does, or returns ``None``
+    when no segment overlaps.  When segment start and end times are both
+    non-decreasing (the normal case), the overlapping run is located by
+    bisection instead of a full scan; each distinct range is joined once.
+    """
+    segments = transcript.segments
+    starts = [seg.start_ms for seg in segments]
+    ends = [seg.end_ms for seg in segments]
+    ordered = all(a <= b for a, b in pairwise(starts)) and all(a <= b for a, b in pairwise(ends))
+
+    @functools.cache
+    def lookup(start_ms: int, end_ms: int) -> str | None:
+        if ordered:
+            texts = [
+                seg.text
+                for seg in segments[bisect_right(ends, start_ms) : bisect_left(starts, end_ms)]
+            ]
+        else:
+            texts = [
+                seg.text for seg in segments if seg.end_ms > start_ms and seg.start_ms < end_ms
+            ]
+        return " ".join(texts) if texts else None
+
+    return lookup
+
+
+def verify_quotes_batch(
+    quotes: Sequence[str],
+    transcript: NormalizedTranscript,
+    ranges: Sequence[tuple[int, int]],
+) -> list[bool]:
+    """Verify many quotes against one transcript.
+
+    Equivalent to calling :func:`verify_quote` for each
+    ``(quote, (start_ms, end_ms))`` pair, but indexes the transcript's
+    segments once and joins each distinct time window only once.
+
+    Args:
+        quotes: Quote texts to verify.
+        transcript: The normalized transcript to search.
+        ranges: ``(start_ms, end_ms)`` window for each quote.
+
+    Returns:
+        One boolean per quote, in input order.
+
+    Raises:
+        ValueError: If *quotes* and *ranges* differ in length.
+    """
+    if len(quotes) != len(ranges):
+        msg = f"Got {len(quotes)} quotes but {len(ranges)} ranges"
+        raise ValueError(msg)
+    lookup = _window_lookup(transcript)
+    results: list[bool] = []
+    for quote, (start_ms, end_ms) in zip(quotes, ranges, strict=True):
+        combined = lookup(start_ms, end_ms)
+        results.append(combined is not None and quote in combined)
+    return results
+
+
 def _check_timestamp_bounds(
     item: ExtractedItem,
     transcript: NormalizedTranscript,
@@ -112,6 +183,7 @@ def validate_items(
     accepted: list[ExtractedItem] = []
     rejected: list[ExtractedItem] = []
     downgraded: list[ExtractedItem] = []
+    window_text = _window_lookup(transcript)
 
     for item in items:
         # Check timestamp bounds
@@ -125,14 +197,12 @@ def validate_items(
             rejected.append(item)
             continue
 
+        # Both text checks below search the same window; join it once
+        combined = window_text(item.transcript_evidence.start_ms, item.transcript_evidence.end_ms)
+
         # Check quote verification for direct_quote items
         if item.type == ItemType.DIRECT_QUOTE:
-            quote_ok = verify_quote(
-                quote_text=item.content,
-                transcript=transcript,
-                start_ms=item.transcript_evidence.start_ms,
-                end_ms=item.transcript_evidence.end_ms,
-            )
+            quote_ok = combined is not None and item.content in combined
             if not quote_ok:
                 if config.quote_mismatch == QuoteMismatchBehavior.REJECT:
                     logger.warning(
@@ -155,12 +225,7 @@ def validate_items(
 
         # Check that transcript_evidence.text is a substring of the
         # transcript within the time range
-        evidence_ok = verify_quote(
-            quote_text=item.transcript_evidence.text,
-            transcript=transcript,
-            start_ms=item.transcript_evidence.start_ms,
-            end_ms=item.transcript_evidence.end_ms,
-        )
+        evidence_ok = combined is not None and item.transcript_evidence.text in combined
         if not evidence_ok:
             logger.warning(
                 "item_rejected_evidence_mismatch",
@@ -5,3 +5,25 @@
 # You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 
 """Shared test fixtures for yt-factify."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from yt_factify.models import TranscriptEvidence
+
+
+@pytest.fixture(scope="session")
+def evidence() -> TranscriptEvidence:
+    """A single transcript evidence span shared by every test in the session."""
+    return TranscriptEvidence(
+        video_id="v1", start_ms=1000, end_ms=5000, text="some transcript text"
+    )
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """A fixed timestamp for ``fetched_at``-style fields, identical across xdist workers."""
+    return datetime(2026, 1, 1, tzinfo=UTC)
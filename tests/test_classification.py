@@ -11,7 +11,8 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -113,14 +114,8 @@ def _make_item(item_id: str = "item_1") -> ExtractedItem:
     )
 
 
-def _mock_llm_response(content: str) -> MagicMock:
-    msg = MagicMock()
-    msg.content = content
-    choice = MagicMock()
-    choice.message = msg
-    response = MagicMock()
-    response.choices = [choice]
-    return response
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 from click.testing import CliRunner
@@ -40,6 +41,9 @@ from yt_factify.models import (
 )
 from yt_factify.pipeline import PipelineError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
 
 def _make_extraction_result() -> ExtractionResult:
     return ExtractionResult(
@@ -91,6 +95,23 @@ def _make_extraction_result() -> ExtractionResult:
     )
 
 
+def _fake_run(outcome: ExtractionResult | Exception) -> Callable[[Coroutine[Any, Any, Any]], Any]:
+    """Build an ``asyncio.run`` stand-in that returns or raises *outcome*.
+
+    The ``run_pipeline`` coroutine is closed rather than left unawaited, so
+    its "never awaited" RuntimeWarning can't surface later inside another
+    test's captured CLI output.
+    """
+
+    def run(coro: Coroutine[Any, Any, Any]) -> Any:
+        coro.close()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return run
+
+
 # ---------------------------------------------------------------------------
 # _parse_video_id
 # ---------------------------------------------------------------------------
@@ -200,7 +221,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -223,7 +244,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -249,7 +270,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -276,7 +297,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -305,7 +326,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -332,7 +353,9 @@ class TestExtractCommand:
     def test_extract_pipeline_error_transcript(self) -> None:
         with patch(
             "yt_factify.cli.asyncio.run",
-            side_effect=PipelineError("Failed to fetch/normalize transcript for vid: error"),
+            side_effect=_fake_run(
+                PipelineError("Failed to fetch/normalize transcript for vid: error")
+            ),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -351,7 +374,7 @@ class TestExtractCommand:
     def test_extract_pipeline_error_llm(self) -> None:
         with patch(
             "yt_factify.cli.asyncio.run",
-            side_effect=PipelineError("Failed to classify video vid: LLM error"),
+            side_effect=_fake_run(PipelineError("Failed to classify video vid: LLM error")),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -370,7 +393,7 @@ class TestExtractCommand:
     def test_extract_unexpected_error(self) -> None:
         with patch(
             "yt_factify.cli.asyncio.run",
-            side_effect=RuntimeError("Unexpected"),
+            side_effect=_fake_run(RuntimeError("Unexpected")),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -400,7 +423,7 @@ class TestExtractCommand:
 
         with patch(
             "yt_factify.cli.asyncio.run",
-            return_value=mock_result,
+            side_effect=_fake_run(mock_result),
         ):
             runner = CliRunner()
             result = runner.invoke(
@@ -11,7 +11,8 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -21,6 +22,7 @@ from yt_factify.extraction import (
     _extract_segment,
     _parse_items_from_response,
     extract_items,
+    parse_batch_response,
 )
 from yt_factify.models import (
     BeliefSystemModule,
@@ -55,15 +57,9 @@ def _make_segment(
     )
 
 
-def _mock_llm_response(content: str) -> MagicMock:
+def _mock_llm_response(content: str) -> SimpleNamespace:
     """Create a mock litellm response with the given content."""
-    msg = MagicMock()
-    msg.content = content
-    choice = MagicMock()
-    choice.message = msg
-    response = MagicMock()
-    response.choices = [choice]
-    return response
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 # ---------------------------------------------------------------------------
@@ -135,6 +131,62 @@ class TestParseItemsFromResponse:
         assert items[0].id.startswith("vid123_seg0_")
 
 
+def _batch_item(item_id: str, text: str, start_ms: int, end_ms: int) -> dict[str, object]:
+    return {
+        "id": item_id,
+        "type": "transcript_fact",
+        "content": text,
+        "transcript_evidence": {"text": text, "start_ms": start_ms, "end_ms": end_ms},
+    }
+
+
+# ---------------------------------------------------------------------------
+# parse_batch_response
+# ---------------------------------------------------------------------------
+
+
+class TestParseBatchResponse:
+    def test_splits_on_markers(self) -> None:
+        segs = [_make_segment("First.", 0, 5000), _make_segment("Second.", 5000, 10000)]
+        raw = (
+            f"[1]\n{json.dumps([_batch_item('a', 'First.', 0, 5000)])}\n"
+            f"[2]\n{json.dumps([_batch_item('b', 'Second.', 5000, 10000)])}\n"
+        )
+        per_segment = parse_batch_response(raw, "vid", segs)
+        assert [[item.id for item in items] for items in per_segment] == [["a"], ["b"]]
+        assert per_segment[1][0].transcript_evidence.video_id == "vid"
+
+    def test_missing_segment_yields_empty_list(self) -> None:
+        segs = [_make_segment("First.", 0, 5000), _make_segment("Second.", 5000, 10000)]
+        raw = f"[2]\n{json.dumps([_batch_item('b', 'Second.', 5000, 10000)])}"
+        per_segment = parse_batch_response(raw, "vid", segs)
+        assert per_segment[0] == []
+        assert len(per_segment[1]) == 1
+
+    def test_fenced_response(self) -> None:
+        segs = [_make_segment("First.", 0, 5000)]
+        raw = f"```\n[1]\n{json.dumps([_batch_item('a', 'First.', 0, 5000)])}\n```"
+        per_segment = parse_batch_response(raw, "vid", segs)
+        assert len(per_segment[0]) == 1
+
+    def test_out_of_range_marker_ignored(self) -> None:
+        per_segment = parse_batch_response("[1]\n[]\n[7]\n[]", "vid", [_make_segment()])
+        assert per_segment == [[]]
+
+    def test_repeated_marker_keeps_all_items(self) -> None:
+        segs = [_make_segment("First. Again.", 0, 5000)]
+        raw = (
+            f"[1]\n{json.dumps([_batch_item('a', 'First.', 0, 5000)])}\n"
+            f"[1]\n{json.dumps([_batch_item('b', 'Again.', 0, 5000)])}\n"
+        )
+        per_segment = parse_batch_response(raw, "vid", segs)
+        assert [item.id for item in per_segment[0]] == ["a", "b"]
+
+    def test_no_markers_raises(self) -> None:
+        with pytest.raises(ValueError, match="segment markers"):
+            parse_batch_response("[]", "vid", [_make_segment()])
+
+
 # ---------------------------------------------------------------------------
 # _extract_segment (mocked LLM)
 # ---------------------------------------------------------------------------
@@ -311,7 +363,7 @@ class TestExtractItems:
 
         original_acompletion = AsyncMock(return_value=mock_response)
 
-        async def tracked_acompletion(**kwargs: object) -> MagicMock:
+        async def tracked_acompletion(**kwargs: object) -> SimpleNamespace:
             nonlocal max_concurrent, current_concurrent
             current_concurrent += 1
             max_concurrent = max(max_concurrent, current_concurrent)
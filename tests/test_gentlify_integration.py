@@ -14,13 +14,32 @@ custom loop with provider-specific retry-after parsing and context logging.
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from gentlify import Throttle, ThrottleSnapshot
 
+from yt_factify import llm as llm_mod
+from yt_factify.config import AppConfig
 from yt_factify.llm import _is_rate_limit_error, _parse_retry_after
 
 
+@pytest.fixture(scope="module")
+def config() -> AppConfig:
+    """One AppConfig shared by the llm_completion tests; none of them mutate it."""
+    return AppConfig(model="test-model")
+
+
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    """Create a minimal litellm-shaped response with the given content."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+async def _no_sleep(_delay: float) -> None:
+    """Stand-in for :func:`asyncio.sleep` that skips rate-limit backoff."""
+
+
 class TestIsRateLimitError:
     def test_rate_limit_class_name(self) -> None:
         exc = type("RateLimitError", (Exception,), {})()
@@ -65,208 +84,179 @@ class TestThrottleInstantiation:
 
 
 class TestLLMCompletionWithThrottle:
-    def test_success_records_completion(self) -> None:
+    async def test_success_records_completion(self, config: AppConfig) -> None:
         """Verify llm_completion with gentlify throttle records success."""
-        from yt_factify.config import AppConfig
         from yt_factify.llm import llm_completion
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=2,
-                total_tasks=1,
-                min_dispatch_interval=0.0,
-            )
-
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "test response"
+        throttle = Throttle(
+            max_concurrency=2,
+            total_tasks=1,
+            min_dispatch_interval=0.0,
+        )
 
-            with patch("yt_factify.llm.litellm") as mock_litellm:
-                mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+        mock_response = _mock_llm_response("test response")
 
-                config = AppConfig(model="test-model")
-                result = await llm_completion(
-                    messages=[{"role": "user", "content": "hello"}],
-                    config=config,
-                    throttle=throttle,
-                )
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = AsyncMock(return_value=mock_response)
 
-                assert result == "test response"
-                snap = throttle.snapshot()
-                assert snap.completed_tasks == 1
+            result = await llm_completion(
+                messages=[{"role": "user", "content": "hello"}],
+                config=config,
+                throttle=throttle,
+            )
 
-        asyncio.run(_run())
+            assert result == "test response"
+            snap = throttle.snapshot()
+            assert snap.completed_tasks == 1
 
-    def test_retry_on_rate_limit_then_success(self) -> None:
+    async def test_retry_on_rate_limit_then_success(self, config: AppConfig) -> None:
         """Custom retry loop retries rate-limit errors via acquire()."""
-        from yt_factify.config import AppConfig
         from yt_factify.llm import llm_completion
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=2,
-                total_tasks=1,
-                min_dispatch_interval=0.0,
-                failure_threshold=10,
-            )
-
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "ok"
+        throttle = Throttle(
+            max_concurrency=2,
+            total_tasks=1,
+            min_dispatch_interval=0.0,
+            failure_threshold=10,
+        )
 
-            call_count = 0
+        mock_response = _mock_llm_response("ok")
 
-            async def side_effect(*args: object, **kwargs: object) -> MagicMock:
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    raise Exception("rate_limit_error: slow down")
-                return mock_response
-
-            with patch("yt_factify.llm.litellm") as mock_litellm:
-                mock_litellm.acompletion = AsyncMock(side_effect=side_effect)
-
-                with patch("yt_factify.llm.asyncio.sleep", new_callable=AsyncMock):
-                    config = AppConfig(model="test-model")
-                    result = await llm_completion(
-                        messages=[{"role": "user", "content": "hello"}],
-                        config=config,
-                        throttle=throttle,
-                    )
-
-                    # Custom retry loop retried after the rate limit error
-                    assert result == "ok"
-                    assert call_count == 2
-                    snap = throttle.snapshot()
-                    # First call failed (recorded by acquire), second succeeded
-                    assert snap.failure_count >= 1
-                    assert snap.completed_tasks >= 1
-
-        asyncio.run(_run())
-
-    def test_exhausted_retries_raises(self) -> None:
-        """When all rate-limit retries are exhausted, the error propagates."""
-        from yt_factify.config import AppConfig
-        from yt_factify.llm import llm_completion
+        call_count = 0
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=2,
-                total_tasks=1,
-                min_dispatch_interval=0.0,
-                failure_threshold=100,
-            )
-
-            with patch("yt_factify.llm.litellm") as mock_litellm:
-                mock_litellm.acompletion = AsyncMock(
-                    side_effect=Exception("rate_limit_error: slow down"),
-                )
+        async def side_effect(*args: object, **kwargs: object) -> SimpleNamespace:
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise Exception("rate_limit_error: slow down")
+            return mock_response
 
-                with patch("yt_factify.llm.asyncio.sleep", new_callable=AsyncMock):
-                    config = AppConfig(model="test-model")
-                    try:
-                        await llm_completion(
-                            messages=[{"role": "user", "content": "hello"}],
-                            config=config,
-                            throttle=throttle,
-                        )
-                        raise AssertionError("Should have raised")  # noqa: TRY301
-                    except Exception as exc:
-                        assert "rate_limit_error" in str(exc)
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = side_effect
 
-                    snap = throttle.snapshot()
-                    assert snap.failure_count >= 1
+            result = await llm_completion(
+                messages=[{"role": "user", "content": "hello"}],
+                config=config,
+                throttle=throttle,
+                sleep=_no_sleep,
+            )
 
-        asyncio.run(_run())
+            # Custom retry loop retried after the rate limit error
+            assert result == "ok"
+            assert call_count == 2
+            snap = throttle.snapshot()
+            # First call failed (recorded by acquire), second succeeded
+            assert snap.failure_count >= 1
+            assert snap.completed_tasks >= 1
 
-    def test_non_rate_limit_error_retries_up_to_max_attempts(self) -> None:
-        """Non-rate-limit errors retry up to max_attempts then propagate."""
-        from yt_factify.config import AppConfig
+    async def test_exhausted_retries_raises(self, config: AppConfig) -> None:
+        """When all rate-limit retries are exhausted, the error propagates."""
         from yt_factify.llm import llm_completion
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=2,
-                total_tasks=1,
-                min_dispatch_interval=0.0,
-            )
-
-            call_count = 0
+        throttle = Throttle(
+            max_concurrency=2,
+            total_tasks=1,
+            min_dispatch_interval=0.0,
+            failure_threshold=100,
+        )
 
-            async def side_effect(*args: object, **kwargs: object) -> None:
-                nonlocal call_count
-                call_count += 1
-                raise ValueError("bad model response")
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = AsyncMock(
+                side_effect=Exception("rate_limit_error: slow down"),
+            )
 
-            with patch("yt_factify.llm.litellm") as mock_litellm:
-                mock_litellm.acompletion = AsyncMock(side_effect=side_effect)
+            try:
+                await llm_completion(
+                    messages=[{"role": "user", "content": "hello"}],
+                    config=config,
+                    throttle=throttle,
+                    sleep=_no_sleep,
+                )
+                raise AssertionError("Should have raised")  # noqa: TRY301
+            except Exception as exc:
+                assert "rate_limit_error" in str(exc)
 
-                config = AppConfig(model="test-model")
-                try:
-                    await llm_completion(
-                        messages=[{"role": "user", "content": "hello"}],
-                        config=config,
-                        max_attempts=2,
-                        throttle=throttle,
-                    )
-                    raise AssertionError("Should have raised")  # noqa: TRY301
-                except ValueError as exc:
-                    assert "bad model response" in str(exc)
+            snap = throttle.snapshot()
+            assert snap.failure_count >= 1
 
-                assert call_count == 2  # retried once, then raised
+    async def test_non_rate_limit_error_retries_up_to_max_attempts(
+        self, config: AppConfig
+    ) -> None:
+        """Non-rate-limit errors retry up to max_attempts then propagate."""
+        from yt_factify.llm import llm_completion
 
-        asyncio.run(_run())
+        throttle = Throttle(
+            max_concurrency=2,
+            total_tasks=1,
+            min_dispatch_interval=0.0,
+        )
 
-    def test_no_throttle_fallback(self) -> None:
-        """Without throttle, llm_completion still works (no retry)."""
-        from yt_factify.config import AppConfig
-        from yt_factify.llm import llm_completion
+        call_count = 0
 
-        async def _run() -> None:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "plain response"
+        async def side_effect(*args: object, **kwargs: object) -> None:
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("bad model response")
 
-            with patch("yt_factify.llm.litellm") as mock_litellm:
-                mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = side_effect
 
-                config = AppConfig(model="test-model")
-                result = await llm_completion(
+            try:
+                await llm_completion(
                     messages=[{"role": "user", "content": "hello"}],
                     config=config,
-                    throttle=None,
+                    max_attempts=2,
+                    throttle=throttle,
                 )
+                raise AssertionError("Should have raised")  # noqa: TRY301
+            except ValueError as exc:
+                assert "bad model response" in str(exc)
 
-                assert result == "plain response"
+            assert call_count == 2  # retried once, then raised
 
-        asyncio.run(_run())
+    async def test_no_throttle_fallback(self, config: AppConfig) -> None:
+        """Without throttle, llm_completion still works (no retry)."""
+        from yt_factify.llm import llm_completion
 
+        mock_response = _mock_llm_response("plain response")
 
-class TestConcurrencyAndDispatch:
-    def test_concurrency_limiting(self) -> None:
-        """Gentlify limits concurrent requests."""
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = AsyncMock(return_value=mock_response)
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=2,
-                min_dispatch_interval=0.0,
-                total_tasks=5,
+            result = await llm_completion(
+                messages=[{"role": "user", "content": "hello"}],
+                config=config,
+                throttle=None,
             )
-            active = 0
-            max_active = 0
 
-            async def task() -> None:
-                nonlocal active, max_active
-                async with throttle.acquire():
-                    active += 1
-                    max_active = max(max_active, active)
-                    await asyncio.sleep(0.05)
-                    active -= 1
+            assert result == "plain response"
 
-            await asyncio.gather(*[task() for _ in range(5)])
-            assert max_active <= 2
 
-        asyncio.run(_run())
+class TestConcurrencyAndDispatch:
+    async def test_concurrency_limiting(self) -> None:
+        """Gentlify limits concurrent requests."""
+        throttle = Throttle(
+            max_concurrency=2,
+            min_dispatch_interval=0.0,
+            total_tasks=5,
+        )
+        active = 0
+        max_active = 0
+
+        async def task() -> None:
+            nonlocal active, max_active
+            async with throttle.acquire():
+                active += 1
+                max_active = max(max_active, active)
+                # Yielding once lets every other task try to acquire while
+                # this one holds a slot; no wall-clock hold is needed.
+                await asyncio.sleep(0)
+                active -= 1
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(5):
+                tg.create_task(task())
+        assert max_active == 2
 
     def test_dispatch_interval_configured(self) -> None:
         """Verify dispatch interval is accepted as a config parameter."""
@@ -280,38 +270,32 @@ class TestConcurrencyAndDispatch:
 
 
 class TestDeceleration:
-    def test_decelerate_on_repeated_failures(self) -> None:
+    async def test_decelerate_on_repeated_failures(self) -> None:
         """Gentlify decelerates concurrency after failure threshold."""
+        throttle = Throttle(
+            max_concurrency=4,
+            min_dispatch_interval=0.0,
+            failure_threshold=3,
+            failure_window=60.0,
+            total_tasks=10,
+        )
 
-        async def _run() -> None:
-            throttle = Throttle(
-                max_concurrency=4,
-                min_dispatch_interval=0.0,
-                failure_threshold=3,
-                failure_window=60.0,
-                total_tasks=10,
-            )
-
-            # Simulate failures by raising inside acquire()
-            for _ in range(3):
-                try:
-                    async with throttle.acquire():
-                        raise Exception("rate_limit_error: slow down")
-                except Exception:
-                    pass
-
-            snap = throttle.snapshot()
-            # After 3 failures, concurrency should have been reduced
-            assert snap.concurrency < 4
+        # Simulate failures by raising inside acquire()
+        for _ in range(3):
+            try:
+                async with throttle.acquire():
+                    raise Exception("rate_limit_error: slow down")
+            except Exception:
+                pass
 
-        asyncio.run(_run())
+        snap = throttle.snapshot()
+        # After 3 failures, concurrency should have been reduced
+        assert snap.concurrency < 4
 
 
 class TestPipelineThrottleConfig:
     def test_pipeline_creates_throttle_with_config(self) -> None:
         """Verify pipeline instantiates Throttle with correct config values."""
-        from yt_factify.config import AppConfig
-
         config = AppConfig(
             model="test-model",
             max_concurrent_requests=5,
@@ -340,17 +324,14 @@ class TestSnapshot:
         assert snap.concurrency == 3
         assert snap.max_concurrency == 3
 
-    def test_snapshot_after_completions(self) -> None:
-        async def _run() -> None:
-            t = Throttle(
-                max_concurrency=3,
-                total_tasks=3,
-                min_dispatch_interval=0.0,
-            )
-            for _ in range(3):
-                async with t.acquire():
-                    pass
-            snap = t.snapshot()
-            assert snap.completed_tasks == 3
-
-        asyncio.run(_run())
+    async def test_snapshot_after_completions(self) -> None:
+        t = Throttle(
+            max_concurrency=3,
+            total_tasks=3,
+            min_dispatch_interval=0.0,
+        )
+        for _ in range(3):
+            async with t.acquire():
+                pass
+        snap = t.snapshot()
+        assert snap.completed_tasks == 3
@@ -9,11 +9,15 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import subprocess
+import sys
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+import yt_factify
 from yt_factify import (
     AppConfig,
     ExtractionResult,
@@ -114,6 +118,22 @@ class TestReExports:
     def test_extract_sync_importable(self) -> None:
         assert callable(extract_sync)
 
+    def test_pipeline_exports_resolve_to_pipeline_module(self) -> None:
+        from yt_factify import pipeline
+
+        assert PipelineError is pipeline.PipelineError
+        assert yt_factify.run_pipeline is pipeline.run_pipeline
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError, match="no attribute 'nonexistent'"):
+            _ = yt_factify.nonexistent
+
+    def test_pipeline_not_imported_eagerly(self) -> None:
+        code = "import sys, yt_factify.models; sys.exit('yt_factify.pipeline' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+        assert proc.returncode == 0
+
 
 # ---------------------------------------------------------------------------
 # extract() — async
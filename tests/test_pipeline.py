@@ -8,11 +8,15 @@
 
 from __future__ import annotations
 
-import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from collections.abc import Awaitable, Callable
+from typing import NoReturn
+from unittest.mock import MagicMock
 
 import pytest
+from pydantic import BaseModel
 
+from yt_factify import pipeline
 from yt_factify.config import AppConfig
 from yt_factify.models import (
     BeliefSystemModule,
@@ -20,6 +24,7 @@ from yt_factify.models import (
     CredibilityAssessment,
     CredibilityLabel,
     ExtractedItem,
+    ExtractionResult,
     ItemType,
     NormalizedSegment,
     NormalizedTranscript,
@@ -36,90 +41,76 @@ from yt_factify.models import (
 from yt_factify.pipeline import PipelineError, run_pipeline
 
 
-def _make_config(**overrides: object) -> AppConfig:
-    defaults: dict[str, object] = {
-        "model": "gpt-4o-mini",
-        "max_retries": 2,
-        "max_concurrent_requests": 2,
-        "segment_seconds": 45,
-    }
-    defaults.update(overrides)
-    return AppConfig(**defaults)  # type: ignore[arg-type]
+@pytest.fixture(scope="module")
+def config() -> AppConfig:
+    return AppConfig(
+        model="gpt-4o-mini",
+        max_retries=2,
+        max_concurrent_requests=2,
+        segment_seconds=45,
+    )
+
+
+SEGMENT_TEXTS = (
+    "Data classes were introduced in Python 3.7.",
+    "They reduce boilerplate code significantly.",
+    "You can use frozen=True for immutability.",
+)
+FULL_TEXT = " ".join(SEGMENT_TEXTS)
+SEGMENT_MS = 5000
 
 
-def _make_raw_transcript() -> RawTranscript:
-    return RawTranscript(
+@pytest.fixture(scope="module")
+def raw_transcript() -> RawTranscript:
+    return RawTranscript.model_construct(
         video_id="test_vid",
         segments=[
-            TranscriptSegmentRaw(
-                text="Data classes were introduced in Python 3.7.",
-                start_ms=0,
-                end_ms=5000,
-            ),
-            TranscriptSegmentRaw(
-                text="They reduce boilerplate code significantly.",
-                start_ms=5000,
-                end_ms=10000,
-            ),
-            TranscriptSegmentRaw(
-                text="You can use frozen=True for immutability.",
-                start_ms=10000,
-                end_ms=15000,
-            ),
+            TranscriptSegmentRaw.model_construct(
+                text=text,
+                start_ms=i * SEGMENT_MS,
+                end_ms=(i + 1) * SEGMENT_MS,
+            )
+            for i, text in enumerate(SEGMENT_TEXTS)
         ],
     )
 
 
-def _make_normalized_transcript() -> NormalizedTranscript:
-    segs = [
-        NormalizedSegment(
-            text="Data classes were introduced in Python 3.7.",
-            start_ms=0,
-            end_ms=5000,
-            hash="h0",
-        ),
-        NormalizedSegment(
-            text="They reduce boilerplate code significantly.",
-            start_ms=5000,
-            end_ms=10000,
-            hash="h1",
-        ),
-        NormalizedSegment(
-            text="You can use frozen=True for immutability.",
-            start_ms=10000,
-            end_ms=15000,
-            hash="h2",
-        ),
-    ]
-    full = " ".join(s.text for s in segs)
-    return NormalizedTranscript(
+@pytest.fixture(scope="module")
+def normalized_transcript() -> NormalizedTranscript:
+    return NormalizedTranscript.model_construct(
         video_id="test_vid",
-        full_text=full,
+        full_text=FULL_TEXT,
         hash="full_hash",
-        segments=segs,
+        segments=[
+            NormalizedSegment.model_construct(
+                text=text,
+                start_ms=i * SEGMENT_MS,
+                end_ms=(i + 1) * SEGMENT_MS,
+                hash=f"h{i}",
+            )
+            for i, text in enumerate(SEGMENT_TEXTS)
+        ],
     )
 
 
-def _make_segments() -> list[TranscriptSegment]:
+@pytest.fixture(scope="module")
+def segments() -> list[TranscriptSegment]:
     return [
-        TranscriptSegment(
-            text=(
-                "Data classes were introduced in Python 3.7. "
-                "They reduce boilerplate code significantly. "
-                "You can use frozen=True for immutability."
-            ),
+        TranscriptSegment.model_construct(
+            text=FULL_TEXT,
             start_ms=0,
-            end_ms=15000,
+            end_ms=len(SEGMENT_TEXTS) * SEGMENT_MS,
             hash="seg_hash",
-            source_segment_indices=[0, 1, 2],
+            source_segment_indices=list(range(len(SEGMENT_TEXTS))),
         ),
     ]
 
 
-def _make_classification() -> VideoClassification:
-    return VideoClassification(
+@pytest.fixture(scope="module")
+def classification() -> VideoClassification:
+    return VideoClassification.model_construct(
         categories=[VideoCategory.TUTORIAL],
-        bias_profile=BiasProfile(
+        bias_profile=BiasProfile.model_construct(
             primary_label="neutral",
             confidence=0.9,
             rationale="Technical tutorial with no political content.",
@@ -127,77 +118,51 @@ def _make_classification() -> VideoClassification:
     )
 
 
-def _make_extracted_items() -> list[ExtractedItem]:
+@pytest.fixture(scope="module")
+def extracted_items() -> list[ExtractedItem]:
     return [
-        ExtractedItem(
-            id="item_1",
-            type=ItemType.TRANSCRIPT_FACT,
-            content="Data classes were introduced in Python 3.7.",
-            transcript_evidence=TranscriptEvidence(
-                video_id="test_vid",
-                start_ms=0,
-                end_ms=5000,
-                text="Data classes were introduced in Python 3.7.",
-            ),
-        ),
-        ExtractedItem(
-            id="item_2",
+        ExtractedItem.model_construct(
+            id=f"item_{i + 1}",
             type=ItemType.TRANSCRIPT_FACT,
-            content="They reduce boilerplate code significantly.",
-            transcript_evidence=TranscriptEvidence(
+            content=text,
+            transcript_evidence=TranscriptEvidence.model_construct(
                 video_id="test_vid",
-                start_ms=5000,
-                end_ms=10000,
-                text="They reduce boilerplate code significantly.",
+                start_ms=i * SEGMENT_MS,
+                end_ms=(i + 1) * SEGMENT_MS,
+                text=text,
             ),
-        ),
-        ExtractedItem(
-            id="item_3",
-            type=ItemType.TRANSCRIPT_FACT,
-            content="You can use frozen=True for immutability.",
-            transcript_evidence=TranscriptEvidence(
-                video_id="test_vid",
-                start_ms=10000,
-                end_ms=15000,
-                text="You can use frozen=True for immutability.",
-            ),
-        ),
+        )
+        for i, text in enumerate(SEGMENT_TEXTS)
     ]
 
 
-def _make_assessed_items() -> list[ExtractedItem]:
-    items = _make_extracted_items()
-    assessed = []
-    for item in items:
-        assessed.append(
-            item.model_copy(
-                update={
-                    "credibility": CredibilityAssessment(
-                        label=CredibilityLabel.WELL_ESTABLISHED,
-                        confidence=0.95,
-                        rationale="Well-known Python feature.",
-                    )
-                }
-            )
-        )
-    return assessed
+@pytest.fixture(scope="module")
+def assessed_items(extracted_items: list[ExtractedItem]) -> list[ExtractedItem]:
+    credibility = CredibilityAssessment.model_construct(
+        label=CredibilityLabel.WELL_ESTABLISHED,
+        confidence=0.95,
+        rationale="Well-known Python feature.",
+    )
+    return [item.model_copy(update={"credibility": credibility}) for item in extracted_items]
 
 
-def _make_topic_threads() -> list[TopicThread]:
+@pytest.fixture(scope="module")
+def topic_threads() -> list[TopicThread]:
     return [
-        TopicThread(
+        TopicThread.model_construct(
             label="python_data_classes",
             display_name="Python Data Classes",
             summary="Discussion of Python data classes.",
             item_ids=["item_1", "item_2", "item_3"],
-            timeline=[TopicTimeSpan(start_ms=0, end_ms=15000)],
+            timeline=[TopicTimeSpan.model_construct(start_ms=0, end_ms=15000)],
         ),
     ]
 
 
-def _make_builtin_modules() -> list[BeliefSystemModule]:
+@pytest.fixture(scope="module")
+def builtin_modules() -> list[BeliefSystemModule]:
     return [
-        BeliefSystemModule(
+        BeliefSystemModule.model_construct(
             label="scientific_materialism",
             display_name="Scientific Materialism",
             description="Empirical evidence worldview.",
@@ -206,10 +171,111 @@ def _make_builtin_modules() -> list[BeliefSystemModule]:
     ]
 
 
-def _make_validation_result(
-    items: list[ExtractedItem],
-) -> ValidationResult:
-    return ValidationResult(accepted=items)
+@pytest.fixture(scope="module")
+def validation_result(extracted_items: list[ExtractedItem]) -> ValidationResult:
+    return ValidationResult.model_construct(accepted=extracted_items)
+
+
+# Stages that run_pipeline awaits; every other stage is called synchronously.
+ASYNC_STAGES = frozenset(
+    {"classify_video", "extract_items", "assess_credibility", "cluster_topic_threads"}
+)
+
+
+def _returning[T](value: T) -> Callable[..., T]:
+    def stub(*args: object, **kwargs: object) -> T:
+        return value
+
+    return stub
+
+
+def _async_returning[T](value: T) -> Callable[..., Awaitable[T]]:
+    async def stub(*args: object, **kwargs: object) -> T:
+        return value
+
+    return stub
+
+
+def _raising(exc: Exception) -> Callable[..., NoReturn]:
+    def stub(*args: object, **kwargs: object) -> NoReturn:
+        raise exc
+
+    return stub
+
+
+def _async_raising(exc: Exception) -> Callable[..., Awaitable[NoReturn]]:
+    async def stub(*args: object, **kwargs: object) -> NoReturn:
+        raise exc
+
+    return stub
+
+
+@pytest.fixture(scope="module")
+def happy_path_stubs(
+    raw_transcript: RawTranscript,
+    normalized_transcript: NormalizedTranscript,
+    segments: list[TranscriptSegment],
+    classification: VideoClassification,
+    extracted_items: list[ExtractedItem],
+    assessed_items: list[ExtractedItem],
+    topic_threads: list[TopicThread],
+    builtin_modules: list[BeliefSystemModule],
+    validation_result: ValidationResult,
+) -> dict[str, Callable[..., object]]:
+    """Map every stage ``run_pipeline`` calls to a happy-path stub."""
+    return_values: dict[str, object] = {
+        "fetch_transcript": raw_transcript,
+        "normalize_transcript": normalized_transcript,
+        "segment_transcript": segments,
+        "load_belief_modules": [],
+        "classify_video": classification,
+        "extract_items": extracted_items,
+        "validate_items": validation_result,
+        "assess_credibility": assessed_items,
+        "cluster_topic_threads": topic_threads,
+    }
+    stubs: dict[str, Callable[..., object]] = {
+        name: (_async_returning if name in ASYNC_STAGES else _returning)(value)
+        for name, value in return_values.items()
+    }
+    # run_pipeline extends this list in place, so hand out a fresh copy per call.
+    stubs["get_builtin_modules"] = lambda: list(builtin_modules)
+    return stubs
+
+
+@pytest.fixture
+def mocked_pipeline(
+    monkeypatch: pytest.MonkeyPatch, happy_path_stubs: dict[str, Callable[..., object]]
+) -> None:
+    """Install the happy-path stubs for a single test.
+
+    Tests that exercise a failure, or need to inspect a call, override a
+    single stage on top of this.
+    """
+    for name, stub in happy_path_stubs.items():
+        monkeypatch.setattr(pipeline, name, stub)
+
+
+@pytest.fixture(scope="module")
+async def pipeline_result(
+    config: AppConfig, happy_path_stubs: dict[str, Callable[..., object]]
+) -> ExtractionResult:
+    """Run the happy path once and share the result with read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, stub in happy_path_stubs.items():
+            mp.setattr(pipeline, name, stub)
+        return await run_pipeline("test_vid", config)
+
+
+# Each stage that can fail, paired with the PipelineError message it produces.
+FAILURE_CASES = [
+    ("fetch_transcript", re.compile("fetch/normalize")),
+    ("classify_video", re.compile("classify")),
+    ("extract_items", re.compile("extract")),
+    ("validate_items", re.compile("validate")),
+    ("assess_credibility", re.compile("credibility")),
+    ("cluster_topic_threads", re.compile("topic threads")),
+]
 
 
 # ---------------------------------------------------------------------------
@@ -218,426 +284,96 @@ def _make_validation_result(
 
 
 class TestRunPipeline:
-    def test_full_pipeline_success(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        assessed = _make_assessed_items()
-        threads = _make_topic_threads()
-        modules = _make_builtin_modules()
-        validation = _make_validation_result(extracted)
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ) as mock_fetch,
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                return_value=validation,
-            ),
-            patch(
-                "yt_factify.pipeline.assess_credibility",
-                new_callable=AsyncMock,
-                return_value=assessed,
-            ),
-            patch(
-                "yt_factify.pipeline.cluster_topic_threads",
-                new_callable=AsyncMock,
-                return_value=threads,
-            ),
-        ):
-            config = _make_config()
-            result = asyncio.run(run_pipeline("test_vid", config))
-
-            assert result.video.video_id == "test_vid"
-            assert result.video.url == "https://www.youtube.com/watch?v=test_vid"
-            assert len(result.items) == 3
-            assert len(result.topic_threads) == 1
-            assert result.classification.categories == [VideoCategory.TUTORIAL]
-            assert result.audit.model_id == "gpt-4o-mini"
-            assert result.audit.yt_factify_version is not None
-            assert len(result.audit.segment_hashes) == 1
-
-            mock_fetch.assert_called_once_with("test_vid", config)
-
-    def test_transcript_fetch_failure(self) -> None:
-        with patch(
-            "yt_factify.pipeline.fetch_transcript",
-            side_effect=RuntimeError("Network error"),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="fetch/normalize"):
-                asyncio.run(run_pipeline("test_vid", config))
-
-    def test_classification_failure(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        modules = _make_builtin_modules()
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                side_effect=RuntimeError("LLM down"),
-            ),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="classify"):
-                asyncio.run(run_pipeline("test_vid", config))
-
-    def test_extraction_failure(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        modules = _make_builtin_modules()
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                side_effect=RuntimeError("Extraction failed"),
-            ),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="extract"):
-                asyncio.run(run_pipeline("test_vid", config))
-
-    def test_validation_failure(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        modules = _make_builtin_modules()
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                side_effect=RuntimeError("Validation error"),
-            ),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="validate"):
-                asyncio.run(run_pipeline("test_vid", config))
-
-    def test_audit_bundle_complete(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        assessed = _make_assessed_items()
-        threads = _make_topic_threads()
-        modules = _make_builtin_modules()
-        validation = _make_validation_result(extracted)
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                return_value=validation,
-            ),
-            patch(
-                "yt_factify.pipeline.assess_credibility",
-                new_callable=AsyncMock,
-                return_value=assessed,
-            ),
-            patch(
-                "yt_factify.pipeline.cluster_topic_threads",
-                new_callable=AsyncMock,
-                return_value=threads,
-            ),
-        ):
-            config = _make_config()
-            result = asyncio.run(run_pipeline("test_vid", config))
-
-            audit = result.audit
-            assert audit.model_id == "gpt-4o-mini"
-            assert audit.yt_factify_version is not None
-            assert audit.processing_timestamp is not None
-            assert len(audit.segment_hashes) == 1
-            assert audit.segment_hashes[0] == "seg_hash"
-            assert audit.prompt_templates_hash == "seg_hash"
-
-    def test_custom_modules_dir(self, tmp_path: MagicMock) -> None:
+    def test_full_pipeline_success(self, pipeline_result: ExtractionResult) -> None:
+        result = pipeline_result
+        assert result.video.video_id == "test_vid"
+        assert result.video.url == "https://www.youtube.com/watch?v=test_vid"
+        assert len(result.items) == 3
+        assert len(result.topic_threads) == 1
+        assert result.classification.categories == [VideoCategory.TUTORIAL]
+        assert result.audit.model_id == "gpt-4o-mini"
+        assert result.audit.yt_factify_version is not None
+        assert len(result.audit.segment_hashes) == 1
+
+    def test_audit_bundle_complete(self, pipeline_result: ExtractionResult) -> None:
+        audit = pipeline_result.audit
+        assert audit.model_id == "gpt-4o-mini"
+        assert audit.yt_factify_version is not None
+        assert audit.processing_timestamp is not None
+        assert len(audit.segment_hashes) == 1
+        assert audit.segment_hashes[0] == "seg_hash"
+        assert audit.prompt_templates_hash == "seg_hash"
+
+    async def test_fetches_requested_video(
+        self,
+        config: AppConfig,
+        mocked_pipeline: None,
+        monkeypatch: pytest.MonkeyPatch,
+        raw_transcript: RawTranscript,
+    ) -> None:
+        mock_fetch = MagicMock(return_value=raw_transcript)
+        monkeypatch.setattr(pipeline, "fetch_transcript", mock_fetch)
+        await run_pipeline("test_vid", config)
+
+        assert mock_fetch.call_count == 1
+        video_id, passed_config = mock_fetch.call_args.args
+        assert video_id == "test_vid"
+        assert passed_config is config
+
+    async def test_custom_modules_dir(
+        self, config: AppConfig, mocked_pipeline: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """When modules_dir is set, custom modules are loaded."""
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        assessed = _make_assessed_items()
-        threads = _make_topic_threads()
-        modules = _make_builtin_modules()
-        validation = _make_validation_result(extracted)
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.load_belief_modules",
-                return_value=[],
-            ) as mock_load,
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                return_value=validation,
-            ),
-            patch(
-                "yt_factify.pipeline.assess_credibility",
-                new_callable=AsyncMock,
-                return_value=assessed,
-            ),
-            patch(
-                "yt_factify.pipeline.cluster_topic_threads",
-                new_callable=AsyncMock,
-                return_value=threads,
-            ),
-        ):
-            config = _make_config(modules_dir="/custom/modules")
-            asyncio.run(run_pipeline("test_vid", config))
-            mock_load.assert_called_once()
-
-    def test_credibility_failure(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        modules = _make_builtin_modules()
-        validation = _make_validation_result(extracted)
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                return_value=validation,
-            ),
-            patch(
-                "yt_factify.pipeline.assess_credibility",
-                new_callable=AsyncMock,
-                side_effect=RuntimeError("Credibility failed"),
-            ),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="credibility"):
-                asyncio.run(run_pipeline("test_vid", config))
-
-    def test_topic_threading_failure(self) -> None:
-        raw = _make_raw_transcript()
-        transcript = _make_normalized_transcript()
-        segments = _make_segments()
-        classification = _make_classification()
-        extracted = _make_extracted_items()
-        assessed = _make_assessed_items()
-        modules = _make_builtin_modules()
-        validation = _make_validation_result(extracted)
-
-        with (
-            patch(
-                "yt_factify.pipeline.fetch_transcript",
-                return_value=raw,
-            ),
-            patch(
-                "yt_factify.pipeline.normalize_transcript",
-                return_value=transcript,
-            ),
-            patch(
-                "yt_factify.pipeline.segment_transcript",
-                return_value=segments,
-            ),
-            patch(
-                "yt_factify.pipeline.get_builtin_modules",
-                return_value=modules,
-            ),
-            patch(
-                "yt_factify.pipeline.classify_video",
-                new_callable=AsyncMock,
-                return_value=classification,
-            ),
-            patch(
-                "yt_factify.pipeline.extract_items",
-                new_callable=AsyncMock,
-                return_value=extracted,
-            ),
-            patch(
-                "yt_factify.pipeline.validate_items",
-                return_value=validation,
-            ),
-            patch(
-                "yt_factify.pipeline.assess_credibility",
-                new_callable=AsyncMock,
-                return_value=assessed,
-            ),
-            patch(
-                "yt_factify.pipeline.cluster_topic_threads",
-                new_callable=AsyncMock,
-                side_effect=RuntimeError("Threading failed"),
-            ),
-        ):
-            config = _make_config()
-            with pytest.raises(PipelineError, match="topic threads"):
-                asyncio.run(run_pipeline("test_vid", config))
+        mock_load = MagicMock(return_value=[])
+        monkeypatch.setattr(pipeline, "load_belief_modules", mock_load)
+        custom_config = config.model_copy(update={"modules_dir": "/custom/modules"})
+        await run_pipeline("test_vid", custom_config)
+        mock_load.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("target", "match"), FAILURE_CASES, ids=[target for target, _ in FAILURE_CASES]
+    )
+    async def test_stage_failure(
+        self,
+        config: AppConfig,
+        mocked_pipeline: None,
+        monkeypatch: pytest.MonkeyPatch,
+        target: str,
+        match: re.Pattern[str],
+    ) -> None:
+        raising = _async_raising if target in ASYNC_STAGES else _raising
+        monkeypatch.setattr(pipeline, target, raising(RuntimeError("boom")))
+        with pytest.raises(PipelineError, match=match):
+            await run_pipeline("test_vid", config)
+
+
+# ---------------------------------------------------------------------------
+# Fixture data
+# ---------------------------------------------------------------------------
+
+
+class TestFixtureData:
+    def test_fixtures_pass_validation(
+        self,
+        raw_transcript: RawTranscript,
+        normalized_transcript: NormalizedTranscript,
+        segments: list[TranscriptSegment],
+        classification: VideoClassification,
+        assessed_items: list[ExtractedItem],
+        topic_threads: list[TopicThread],
+        builtin_modules: list[BeliefSystemModule],
+        validation_result: ValidationResult,
+    ) -> None:
+        """The fixtures skip validation, so check once that they would pass it."""
+        models: list[BaseModel] = [
+            raw_transcript,
+            normalized_transcript,
+            classification,
+            validation_result,
+            *segments,
+            *assessed_items,
+            *topic_threads,
+            *builtin_modules,
+        ]
+        for model in models:
+            assert type(model).model_validate(model.model_dump()) == model
@@ -8,6 +8,10 @@
 
 from __future__ import annotations
 
+import tracemalloc
+
+import pytest
+
 from yt_factify.models import (
     BeliefSystemModule,
     ExtractedItem,
@@ -18,13 +22,29 @@ from yt_factify.models import (
     TranscriptSegment,
     VideoCategory,
 )
-from yt_factify.prompts import hash_prompts
+from yt_factify.prompts import (
+    PromptParts,
+    _belief_module_key,
+    _format_belief_module,
+    classification,
+    credibility,
+    extraction,
+    hash_prompts,
+    hash_prompts_batch,
+)
 from yt_factify.prompts.classification import (
     build_bias_messages,
     build_classification_messages,
 )
 from yt_factify.prompts.credibility import build_credibility_messages
-from yt_factify.prompts.extraction import build_extraction_messages
+from yt_factify.prompts.extraction import (
+    DEFAULT_BATCH_SIZE,
+    build_extraction_messages,
+    build_extraction_messages_batch,
+    build_extraction_prompt_parts,
+)
+
+_HEX = frozenset("0123456789abcdef")
 
 
 def _make_segment(
@@ -83,6 +103,31 @@ def _make_item(item_id: str = "item_1") -> ExtractedItem:
     )
 
 
+# Default-argument instances, validated once and shared by every test in this
+# module (the builders only read them). Tests needing variants call the
+# factories above directly.
+
+
+@pytest.fixture(scope="module")
+def segment() -> TranscriptSegment:
+    return _make_segment()
+
+
+@pytest.fixture(scope="module")
+def transcript() -> NormalizedTranscript:
+    return _make_transcript()
+
+
+@pytest.fixture(scope="module")
+def belief_module() -> BeliefSystemModule:
+    return _make_belief_module()
+
+
+@pytest.fixture(scope="module")
+def item() -> ExtractedItem:
+    return _make_item()
+
+
 # ---------------------------------------------------------------------------
 # hash_prompts
 # ---------------------------------------------------------------------------
@@ -101,8 +146,8 @@ class TestHashPrompts:
 
     def test_returns_hex_sha256(self) -> None:
         h = hash_prompts("test")
-        assert len(h) == 64
-        assert all(c in "0123456789abcdef" for c in h)
+        assert set(h) <= _HEX
+        assert len(bytes.fromhex(h)) == 32
 
     def test_order_matters(self) -> None:
         h1 = hash_prompts("A", "B")
@@ -110,22 +155,39 @@ class TestHashPrompts:
         assert h1 != h2
 
 
+class TestHashPromptsBatch:
+    def test_matches_hash_prompts(self) -> None:
+        tails = ["user A", "user B", ""]
+        assert hash_prompts_batch("system", tails) == [hash_prompts("system", t) for t in tails]
+
+    def test_deterministic(self) -> None:
+        assert hash_prompts_batch("system", ["a", "b"]) == hash_prompts_batch(
+            "system", iter(["a", "b"])
+        )
+
+    def test_returns_hex_sha256(self) -> None:
+        (h,) = hash_prompts_batch("system", ["user"])
+        assert set(h) <= _HEX
+        assert len(bytes.fromhex(h)) == 32
+
+    def test_empty_tails(self) -> None:
+        assert hash_prompts_batch("system", []) == []
+
+
 # ---------------------------------------------------------------------------
 # Extraction prompts
 # ---------------------------------------------------------------------------
 
 
 class TestBuildExtractionMessages:
-    def test_basic_structure(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="vid1")
+    def test_basic_structure(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="vid1")
         assert len(msgs) == 2
         assert msgs[0]["role"] == "system"
         assert msgs[1]["role"] == "user"
 
-    def test_system_prompt_not_empty(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="vid1")
+    def test_system_prompt_not_empty(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="vid1")
         assert len(msgs[0]["content"]) > 100
 
     def test_user_prompt_contains_transcript(self) -> None:
@@ -133,9 +195,8 @@ class TestBuildExtractionMessages:
         msgs = build_extraction_messages(seg, video_id="vid1")
         assert "Python is great" in msgs[1]["content"]
 
-    def test_user_prompt_contains_video_id(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="abc123")
+    def test_user_prompt_contains_video_id(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="abc123")
         assert "abc123" in msgs[1]["content"]
 
     def test_user_prompt_contains_timestamps(self) -> None:
@@ -144,40 +205,36 @@ class TestBuildExtractionMessages:
         assert "1000" in msgs[1]["content"]
         assert "5000" in msgs[1]["content"]
 
-    def test_categories_included(self) -> None:
-        seg = _make_segment()
+    def test_categories_included(self, segment: TranscriptSegment) -> None:
         msgs = build_extraction_messages(
-            seg,
+            segment,
             video_id="vid1",
             categories=[VideoCategory.TUTORIAL, VideoCategory.INTERVIEW],
         )
         assert "tutorial" in msgs[0]["content"]
         assert "interview" in msgs[0]["content"]
 
-    def test_belief_modules_included(self) -> None:
-        seg = _make_segment()
-        module = _make_belief_module()
+    def test_belief_modules_included(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule
+    ) -> None:
         msgs = build_extraction_messages(
-            seg,
+            segment,
             video_id="vid1",
-            belief_modules=[module],
+            belief_modules=[belief_module],
         )
         assert "Scientific Materialism" in msgs[0]["content"]
         assert "scientific_materialism" in msgs[0]["content"]
 
-    def test_no_categories_no_section(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="vid1")
+    def test_no_categories_no_section(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="vid1")
         assert "Video Categories" not in msgs[0]["content"]
 
-    def test_no_belief_modules_no_section(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="vid1")
+    def test_no_belief_modules_no_section(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="vid1")
         assert "Belief/Value Systems" not in msgs[0]["content"]
 
-    def test_item_types_in_system_prompt(self) -> None:
-        seg = _make_segment()
-        msgs = build_extraction_messages(seg, video_id="vid1")
+    def test_item_types_in_system_prompt(self, segment: TranscriptSegment) -> None:
+        msgs = build_extraction_messages(segment, video_id="vid1")
         system = msgs[0]["content"]
         assert "direct_quote" in system
         assert "transcript_fact" in system
@@ -186,6 +243,132 @@ class TestBuildExtractionMessages:
         assert "unverified_claim" in system
         assert "prediction" in system
 
+    def test_system_prompt_cached(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule
+    ) -> None:
+        categories = [VideoCategory.TUTORIAL]
+        first = build_extraction_messages(
+            segment, video_id="vid1", categories=categories, belief_modules=[belief_module]
+        )
+        hits = extraction._render_system.cache_info().hits
+        second = build_extraction_messages(
+            _make_segment(text="Other text"),
+            video_id="vid2",
+            categories=categories,
+            belief_modules=[_make_belief_module()],
+        )
+        assert extraction._render_system.cache_info().hits > hits
+        assert second[0]["content"] is first[0]["content"]
+
+    def test_cache_keyed_on_module_content(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule
+    ) -> None:
+        edited = belief_module.model_copy(update={"description": "A different description."})
+        first = build_extraction_messages(segment, "vid1", belief_modules=[belief_module])
+        second = build_extraction_messages(segment, "vid1", belief_modules=[edited])
+        assert "A different description." not in first[0]["content"]
+        assert "A different description." in second[0]["content"]
+
+
+class TestBuildExtractionPromptParts:
+    def test_parts_match_messages(self) -> None:
+        seg = _make_segment(text="Python is great")
+        parts = build_extraction_prompt_parts(
+            seg, video_id="vid1", categories=[VideoCategory.TUTORIAL]
+        )
+        msgs = build_extraction_messages(seg, video_id="vid1", categories=[VideoCategory.TUTORIAL])
+        assert "".join(parts.shared) == msgs[0]["content"]
+        assert parts.per_call == msgs[1]["content"]
+        assert parts.to_messages() == msgs
+
+    def test_shared_preamble_is_one_object(self, belief_module: BeliefSystemModule) -> None:
+        a = build_extraction_prompt_parts(
+            _make_segment("One"), "vid1", belief_modules=[belief_module]
+        )
+        b = build_extraction_prompt_parts(
+            _make_segment("Two"), "vid1", belief_modules=[belief_module]
+        )
+        assert a.shared is b.shared
+        assert a.shared[0] is extraction.EXTRACTION_SYSTEM_PROMPT
+        assert a.system is b.system
+
+    def test_peak_memory_independent_of_segment_count(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule
+    ) -> None:
+        module = belief_module.model_copy(update={"description": "x" * 200_000})
+        preamble = build_extraction_prompt_parts(segment, "vid1", belief_modules=[module]).system
+
+        tracemalloc.start()
+        try:
+            prompts = [
+                build_extraction_prompt_parts(
+                    _make_segment(f"Segment {i}"), "vid1", belief_modules=[module]
+                ).to_messages()
+                for i in range(50)
+            ]
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(prompts) == 50
+        assert peak < len(preamble)
+
+    def test_prompt_parts_is_frozen(self) -> None:
+        parts = PromptParts(shared=("a",), per_call="b")
+        with pytest.raises(AttributeError):
+            parts.per_call = "c"  # type: ignore[misc]
+
+
+class TestBuildExtractionMessagesBatch:
+    def test_single_batch_structure(self) -> None:
+        segs = [_make_segment(text=f"Segment {i}") for i in range(3)]
+        batches = build_extraction_messages_batch(segs, video_id="vid1")
+        assert len(batches) == 1
+        assert [m["role"] for m in batches[0]] == ["system", "user"]
+
+    def test_each_transcript_appears_once(self) -> None:
+        segs = [_make_segment(text=f"Segment number {i}") for i in range(4)]
+        (msgs,) = build_extraction_messages_batch(segs, video_id="vid1")
+        user = msgs[1]["content"]
+        for i, seg in enumerate(segs, start=1):
+            assert user.count(seg.text) == 1
+            assert f"[{i}] video_id=vid1" in user
+
+    def test_system_prompt_appears_once(self) -> None:
+        segs = [_make_segment(text=f"Segment {i}") for i in range(4)]
+        (msgs,) = build_extraction_messages_batch(segs, video_id="vid1")
+        assert sum(m["role"] == "system" for m in msgs) == 1
+        assert msgs[0]["content"].count("## Item Types") == 1
+        assert "## Item Types" not in msgs[1]["content"]
+
+    def test_splits_into_batches(self) -> None:
+        segs = [_make_segment(text=f"Segment {i}") for i in range(DEFAULT_BATCH_SIZE + 1)]
+        batches = build_extraction_messages_batch(segs, video_id="vid1")
+        assert len(batches) == 2
+        assert f"[{DEFAULT_BATCH_SIZE}]" in batches[0][1]["content"]
+        assert batches[1][1]["content"].startswith("[1] ")
+
+    def test_custom_batch_size(self) -> None:
+        segs = [_make_segment(text=f"Segment {i}") for i in range(5)]
+        batches = build_extraction_messages_batch(segs, video_id="vid1", batch_size=2)
+        assert len(batches) == 3
+
+    def test_context_sections_included(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule
+    ) -> None:
+        (msgs,) = build_extraction_messages_batch(
+            [segment],
+            video_id="vid1",
+            categories=[VideoCategory.TUTORIAL],
+            belief_modules=[belief_module],
+        )
+        assert "tutorial" in msgs[0]["content"]
+        assert "scientific_materialism" in msgs[0]["content"]
+
+    def test_invalid_batch_size_raises(self, segment: TranscriptSegment) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            build_extraction_messages_batch([segment], video_id="vid1", batch_size=0)
+
 
 # ---------------------------------------------------------------------------
 # Classification prompts
@@ -193,21 +376,24 @@ class TestBuildExtractionMessages:
 
 
 class TestBuildClassificationMessages:
-    def test_basic_structure(self) -> None:
-        transcript = _make_transcript()
+    def test_basic_structure(self, transcript: NormalizedTranscript) -> None:
         msgs = build_classification_messages(transcript)
         assert len(msgs) == 2
         assert msgs[0]["role"] == "system"
         assert msgs[1]["role"] == "user"
 
-    def test_system_prompt_contains_categories(self) -> None:
-        transcript = _make_transcript()
+    def test_system_prompt_contains_categories(self, transcript: NormalizedTranscript) -> None:
         msgs = build_classification_messages(transcript)
         system = msgs[0]["content"]
         assert "news" in system
         assert "tutorial" in system
         assert "entertainment" in system
 
+    def test_system_prompt_lists_every_category(self, transcript: NormalizedTranscript) -> None:
+        system = build_classification_messages(transcript)[0]["content"]
+        for category in VideoCategory:
+            assert f"- `{category.value}`" in system
+
     def test_user_prompt_contains_transcript(self) -> None:
         transcript = _make_transcript(text="AI is transforming the world")
         msgs = build_classification_messages(transcript)
@@ -218,17 +404,21 @@ class TestBuildClassificationMessages:
         msgs = build_classification_messages(transcript)
         assert "xyz789" in msgs[1]["content"]
 
+    def test_system_prompt_cached(self, transcript: NormalizedTranscript) -> None:
+        build_classification_messages(transcript)
+        hits = classification._render_system.cache_info().hits
+        build_classification_messages(_make_transcript(video_id="other"))
+        assert classification._render_system.cache_info().hits > hits
+
 
 class TestBuildBiasMessages:
-    def test_basic_structure(self) -> None:
-        transcript = _make_transcript()
+    def test_basic_structure(self, transcript: NormalizedTranscript) -> None:
         msgs = build_bias_messages(transcript, categories=[VideoCategory.NEWS])
         assert len(msgs) == 2
         assert msgs[0]["role"] == "system"
         assert msgs[1]["role"] == "user"
 
-    def test_categories_in_user_prompt(self) -> None:
-        transcript = _make_transcript()
+    def test_categories_in_user_prompt(self, transcript: NormalizedTranscript) -> None:
         msgs = build_bias_messages(
             transcript,
             categories=[VideoCategory.NEWS, VideoCategory.INTERVIEW],
@@ -236,8 +426,7 @@ class TestBuildBiasMessages:
         assert "news" in msgs[1]["content"]
         assert "interview" in msgs[1]["content"]
 
-    def test_system_prompt_covers_bias_types(self) -> None:
-        transcript = _make_transcript()
+    def test_system_prompt_covers_bias_types(self, transcript: NormalizedTranscript) -> None:
         msgs = build_bias_messages(transcript, categories=[VideoCategory.NEWS])
         system = msgs[0]["content"]
         assert "Political bias" in system
@@ -251,15 +440,13 @@ class TestBuildBiasMessages:
 
 
 class TestBuildCredibilityMessages:
-    def test_basic_structure(self) -> None:
-        item = _make_item()
+    def test_basic_structure(self, item: ExtractedItem) -> None:
         msgs = build_credibility_messages([item])
         assert len(msgs) == 2
         assert msgs[0]["role"] == "system"
         assert msgs[1]["role"] == "user"
 
-    def test_system_prompt_contains_labels(self) -> None:
-        item = _make_item()
+    def test_system_prompt_contains_labels(self, item: ExtractedItem) -> None:
         msgs = build_credibility_messages([item])
         system = msgs[0]["content"]
         assert "well_established" in system
@@ -282,20 +469,39 @@ class TestBuildCredibilityMessages:
         assert "item_1" in user
         assert "item_2" in user
 
-    def test_belief_modules_included(self) -> None:
-        item = _make_item()
-        module = _make_belief_module()
-        msgs = build_credibility_messages([item], belief_modules=[module])
+    def test_belief_modules_included(
+        self, belief_module: BeliefSystemModule, item: ExtractedItem
+    ) -> None:
+        msgs = build_credibility_messages([item], belief_modules=[belief_module])
         system = msgs[0]["content"]
         assert "Scientific Materialism" in system
         assert "scientific_materialism" in system
 
-    def test_no_belief_modules_no_section(self) -> None:
-        item = _make_item()
+    def test_no_belief_modules_no_section(self, item: ExtractedItem) -> None:
         msgs = build_credibility_messages([item])
         assert "Active Belief/Value Systems" not in msgs[0]["content"]
 
-    def test_speaker_included_when_present(self) -> None:
-        item = _make_item()
+    def test_system_prompt_cached(
+        self, belief_module: BeliefSystemModule, item: ExtractedItem
+    ) -> None:
+        build_credibility_messages([item], belief_modules=[belief_module])
+        hits = credibility._render_system.cache_info().hits
+        build_credibility_messages([_make_item("other")], belief_modules=[belief_module])
+        assert credibility._render_system.cache_info().hits > hits
+
+    def test_module_block_shared_with_extraction(
+        self, segment: TranscriptSegment, belief_module: BeliefSystemModule, item: ExtractedItem
+    ) -> None:
+        block = _format_belief_module(_belief_module_key(belief_module))
+        cred = build_credibility_messages([item], belief_modules=[belief_module])
+        ext = build_extraction_messages(
+            segment, "vid1", categories=[VideoCategory.NEWS], belief_modules=[belief_module]
+        )
+        assert block in cred[0]["content"]
+        assert block in ext[0]["content"]
+        # An equal module built separately resolves to the same rendered block
+        assert _format_belief_module(_belief_module_key(_make_belief_module())) is block
+
+    def test_speaker_included_when_present(self, item: ExtractedItem) -> None:
         msgs = build_credibility_messages([item])
         assert "narrator" in msgs[1]["content"]
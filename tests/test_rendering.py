@@ -8,9 +8,15 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import json
+import os
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
 
 from yt_factify.models import (
     AuditBundle,
@@ -29,45 +35,62 @@ from yt_factify.models import (
     VideoInfo,
 )
 from yt_factify.rendering import (
+    _format_ms,
     render_json,
+    render_json_bytes,
+    render_many,
     render_markdown,
+    render_markdown_to,
+    write_markdown_output,
     write_output,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+_VIDEO = VideoInfo(
+    video_id="abc123",
+    title="Test Video Title",
+    url="https://www.youtube.com/watch?v=abc123",
+    transcript_hash="hash123",
+    fetched_at=datetime(2026, 1, 15, 12, 0, 0, tzinfo=UTC),
+)
+
+_CLASSIFICATION = VideoClassification(
+    categories=[VideoCategory.TUTORIAL, VideoCategory.INTERVIEW],
+    bias_profile=BiasProfile(
+        primary_label="neutral",
+        confidence=0.85,
+        rationale="Technical content with balanced perspective.",
+    ),
+)
+
+_AUDIT = AuditBundle(
+    model_id="gpt-4o-mini",
+    model_version=None,
+    prompt_templates_hash="prompt_hash",
+    processing_timestamp=datetime(2026, 1, 15, 12, 5, 0, tzinfo=UTC),
+    segment_hashes=["seg_h1", "seg_h2"],
+    yt_factify_version="0.2.2",
+)
+
 
 def _make_result(
     items: list[ExtractedItem] | None = None,
     threads: list[TopicThread] | None = None,
 ) -> ExtractionResult:
+    # The rendering tests only read models, so the validated sub-models above
+    # (and the cached items below) are shared rather than rebuilt per test.
     return ExtractionResult(
-        video=VideoInfo(
-            video_id="abc123",
-            title="Test Video Title",
-            url="https://www.youtube.com/watch?v=abc123",
-            transcript_hash="hash123",
-            fetched_at=datetime(2026, 1, 15, 12, 0, 0, tzinfo=UTC),
-        ),
-        classification=VideoClassification(
-            categories=[VideoCategory.TUTORIAL, VideoCategory.INTERVIEW],
-            bias_profile=BiasProfile(
-                primary_label="neutral",
-                confidence=0.85,
-                rationale="Technical content with balanced perspective.",
-            ),
-        ),
+        video=_VIDEO,
+        classification=_CLASSIFICATION,
         items=items or [],
         topic_threads=threads or [],
-        audit=AuditBundle(
-            model_id="gpt-4o-mini",
-            model_version=None,
-            prompt_templates_hash="prompt_hash",
-            processing_timestamp=datetime(2026, 1, 15, 12, 5, 0, tzinfo=UTC),
-            segment_hashes=["seg_h1", "seg_h2"],
-            yt_factify_version="0.2.2",
-        ),
+        audit=_AUDIT,
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_fact(
     item_id: str = "fact_1",
     content: str = "Python 3.7 introduced data classes.",
@@ -92,6 +115,7 @@ def _make_fact(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_quote(
     item_id: str = "quote_1",
     content: str = "Data classes are a game changer.",
@@ -113,6 +137,7 @@ def _make_quote(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_opinion(item_id: str = "opinion_1") -> ExtractedItem:
     return ExtractedItem(
         id=item_id,
@@ -128,6 +153,7 @@ def _make_opinion(item_id: str = "opinion_1") -> ExtractedItem:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_unverified(item_id: str = "claim_1") -> ExtractedItem:
     return ExtractedItem(
         id=item_id,
@@ -142,6 +168,7 @@ def _make_unverified(item_id: str = "claim_1") -> ExtractedItem:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_prediction(item_id: str = "pred_1") -> ExtractedItem:
     return ExtractedItem(
         id=item_id,
@@ -156,6 +183,7 @@ def _make_prediction(item_id: str = "pred_1") -> ExtractedItem:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_flagged_item() -> ExtractedItem:
     return ExtractedItem(
         id="flagged_1",
@@ -176,8 +204,9 @@ def _make_flagged_item() -> ExtractedItem:
     )
 
 
-def _make_threads() -> list[TopicThread]:
-    return [
+@functools.cache
+def _threads() -> tuple[TopicThread, ...]:
+    return (
         TopicThread(
             label="python_features",
             display_name="Python Features",
@@ -196,7 +225,11 @@ def _make_threads() -> list[TopicThread]:
                 TopicTimeSpan(start_ms=35000, end_ms=40000),
             ],
         ),
-    ]
+    )
+
+
+def _make_threads() -> list[TopicThread]:
+    return list(_threads())
 
 
 # ---------------------------------------------------------------------------
@@ -242,6 +275,16 @@ class TestRenderJson:
         assert parsed["items"] == []
         assert parsed["topic_threads"] == []
 
+    def test_matches_model_dump_json(self) -> None:
+        result = _make_result(items=[_make_fact(), _make_quote()], threads=_make_threads())
+        assert render_json(result) == result.model_dump_json(indent=2)
+
+    def test_bytes_output(self) -> None:
+        result = _make_result(items=[_make_fact()])
+        raw = render_json_bytes(result)
+        assert raw == render_json(result).encode("utf-8")
+        assert ExtractionResult.model_validate_json(raw) == result
+
 
 # ---------------------------------------------------------------------------
 # render_markdown
@@ -345,12 +388,64 @@ class TestRenderMarkdown:
         assert "1:01:01" in md
         assert "1:02:02" in md
 
+    @pytest.mark.parametrize(
+        ("ms", "expected"),
+        [
+            (0, "0:00"),
+            (999, "0:00"),
+            (65_000, "1:05"),
+            (3_599_999, "59:59"),
+            (3_600_000, "1:00:00"),
+            (3_661_000, "1:01:01"),
+            (36_000_000, "10:00:00"),
+        ],
+    )
+    def test_format_ms(self, ms: int, expected: str) -> None:
+        assert _format_ms(ms) == expected
+
     def test_trailing_newline(self) -> None:
         result = _make_result()
         md = render_markdown(result)
         assert md.endswith("\n")
 
 
+class TestRenderMarkdownTo:
+    def test_matches_render_markdown(self) -> None:
+        items = [_make_fact(), _make_quote(), _make_flagged_item()]
+        for result in (
+            _make_result(),
+            _make_result(threads=_make_threads()),
+            _make_result(items=items, threads=_make_threads()),
+        ):
+            buf = io.BytesIO()
+            render_markdown_to(result, buf)
+            assert buf.getvalue() == render_markdown(result).encode("utf-8")
+
+    def test_write_markdown_output(self, tmp_path: Path) -> None:
+        result = _make_result(items=[_make_quote()], threads=_make_threads())
+        output = tmp_path / "sub" / "report.md"
+        write_markdown_output(result, output)
+        assert output.read_text(encoding="utf-8") == render_markdown(result)
+
+    def test_streams_in_chunks(self) -> None:
+        result = _make_result(
+            items=[_make_fact(f"fact_{i}") for i in range(50)], threads=_make_threads()
+        )
+        expected = render_markdown(result).encode("utf-8")
+        chunks: list[bytes] = []
+
+        class RecordingWriter(io.BytesIO):
+            def write(self, data: Buffer, /) -> int:
+                chunk = bytes(data)
+                chunks.append(chunk)
+                return len(chunk)
+
+        render_markdown_to(result, RecordingWriter())
+        assert b"".join(chunks) == expected
+        # No single write carries the whole document
+        assert max(map(len, chunks)) < len(expected)
+
+
 # ---------------------------------------------------------------------------
 # write_output (atomic writes)
 # ---------------------------------------------------------------------------
@@ -381,3 +476,91 @@ class TestWriteOutput:
         write_output("first", output)
         write_output("second", output)
         assert output.read_text() == "second"
+
+    def test_writes_bytes(self, tmp_path: Path) -> None:
+        output = tmp_path / "output.json"
+        write_output(b'{"key": "caf\xc3\xa9"}', output)
+        assert output.read_text(encoding="utf-8") == '{"key": "café"}'
+
+    def test_str_encoded_as_utf8(self, tmp_path: Path) -> None:
+        output = tmp_path / "output.md"
+        write_output("naïve — café\n", output)
+        assert output.read_bytes() == "naïve — café\n".encode()
+
+    def test_fsyncs_before_replace(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = tmp_path / "output.md"
+        calls: list[str] = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd: int) -> None:
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def replace(src: str, dst: Path) -> None:
+            calls.append("replace")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(os, "replace", replace)
+        write_output("content", output)
+        assert calls == ["fsync", "replace"]
+
+    def test_temp_file_removed_on_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        output = tmp_path / "output.md"
+
+        def fail(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", fail)
+        with pytest.raises(OSError, match="disk full"):
+            write_output("content", output)
+        assert list(tmp_path.iterdir()) == []
+
+
+# ---------------------------------------------------------------------------
+# render_many (JSON Lines)
+# ---------------------------------------------------------------------------
+
+
+class TestRenderMany:
+    def test_one_line_per_result(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.jsonl"
+        results = [_make_result(), _make_result(items=[_make_fact()]), _make_result()]
+        render_many(results, output)
+        lines = output.read_bytes().splitlines()
+        assert len(lines) == 3
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.jsonl"
+        results = [_make_result(items=[_make_fact()]), _make_result(threads=_make_threads())]
+        render_many(iter(results), output)
+        restored = [
+            ExtractionResult.model_validate_json(line)
+            for line in output.read_text(encoding="utf-8").splitlines()
+        ]
+        assert restored == results
+
+    def test_appends(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.jsonl"
+        render_many([_make_result()], output)
+        render_many([_make_result(), _make_result()], output)
+        assert len(output.read_bytes().splitlines()) == 3
+
+    def test_creates_parent_dirs(self, tmp_path: Path) -> None:
+        output = tmp_path / "sub" / "dir" / "results.jsonl"
+        render_many([_make_result()], output)
+        assert output.exists()
+
+    def test_single_fsync(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+        real_fsync = os.fsync
+
+        def fsync(fd: int) -> None:
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        render_many([_make_result()] * 5, tmp_path / "results.jsonl")
+        assert len(calls) == 1
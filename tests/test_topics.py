@@ -8,13 +8,15 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from yt_factify import llm as llm_mod
 from yt_factify.config import AppConfig
 from yt_factify.models import (
     ExtractedItem,
@@ -40,6 +42,7 @@ def _make_config(**overrides: object) -> AppConfig:
     return AppConfig(**defaults)  # type: ignore[arg-type]
 
 
+@functools.lru_cache(maxsize=32)
 def _make_item(
     item_id: str = "item_1",
     start_ms: int = 3000,
@@ -59,14 +62,20 @@ def _make_item(
     )
 
 
-def _mock_llm_response(content: str) -> MagicMock:
-    msg = MagicMock()
-    msg.content = content
-    choice = MagicMock()
-    choice.message = msg
-    response = MagicMock()
-    response.choices = [choice]
-    return response
+@pytest.fixture(scope="module")
+def topics_valid_json() -> str:
+    """The canned topic-threading response, read from disk once per module."""
+    return (FIXTURES_DIR / "topics_valid.json").read_text()
+
+
+@pytest.fixture(scope="module")
+def config() -> AppConfig:
+    """One AppConfig shared by the clustering tests; none of them mutate it."""
+    return _make_config()
+
+
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 # ---------------------------------------------------------------------------
@@ -74,68 +83,53 @@ def _mock_llm_response(content: str) -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
-class TestDeriveTimeline:
-    def test_single_item(self) -> None:
-        items = [_make_item("a", start_ms=1000, end_ms=5000)]
-        items_by_id = {i.id: i for i in items}
-        timeline = _derive_timeline(["a"], items_by_id)
-        assert len(timeline) == 1
-        assert timeline[0].start_ms == 1000
-        assert timeline[0].end_ms == 5000
-
-    def test_non_overlapping_spans(self) -> None:
-        items = [
-            _make_item("a", start_ms=1000, end_ms=3000),
-            _make_item("b", start_ms=5000, end_ms=8000),
-        ]
-        items_by_id = {i.id: i for i in items}
-        timeline = _derive_timeline(["a", "b"], items_by_id)
-        assert len(timeline) == 2
-        assert timeline[0].start_ms == 1000
-        assert timeline[1].start_ms == 5000
+_TIMELINE_SHAPES: dict[str, list[tuple[str, int, int]]] = {
+    "empty": [],
+    "a_only": [("a", 1000, 5000)],
+    "ab_nonoverlap": [("a", 1000, 3000), ("b", 5000, 8000)],
+    "ab_overlap": [("a", 1000, 5000), ("b", 3000, 8000)],
+    "ab_adjacent": [("a", 1000, 3000), ("b", 3000, 5000)],
+}
+
+
+@pytest.fixture(scope="module")
+def shapes() -> dict[str, dict[str, ExtractedItem]]:
+    """``items_by_id`` maps for each span layout, built once per module."""
+    return {
+        shape: {
+            item_id: _make_item(item_id, start_ms=start, end_ms=end)
+            for item_id, start, end in spans
+        }
+        for shape, spans in _TIMELINE_SHAPES.items()
+    }
 
-    def test_overlapping_spans_merged(self) -> None:
-        items = [
-            _make_item("a", start_ms=1000, end_ms=5000),
-            _make_item("b", start_ms=3000, end_ms=8000),
-        ]
-        items_by_id = {i.id: i for i in items}
-        timeline = _derive_timeline(["a", "b"], items_by_id)
-        assert len(timeline) == 1
-        assert timeline[0].start_ms == 1000
-        assert timeline[0].end_ms == 8000
 
-    def test_adjacent_spans_merged(self) -> None:
-        items = [
-            _make_item("a", start_ms=1000, end_ms=3000),
-            _make_item("b", start_ms=3000, end_ms=5000),
-        ]
-        items_by_id = {i.id: i for i in items}
-        timeline = _derive_timeline(["a", "b"], items_by_id)
-        assert len(timeline) == 1
-        assert timeline[0].start_ms == 1000
-        assert timeline[0].end_ms == 5000
-
-    def test_unknown_ids_ignored(self) -> None:
-        items = [_make_item("a", start_ms=1000, end_ms=5000)]
-        items_by_id = {i.id: i for i in items}
-        timeline = _derive_timeline(["a", "nonexistent"], items_by_id)
-        assert len(timeline) == 1
-
-    def test_empty_ids(self) -> None:
-        timeline = _derive_timeline([], {})
-        assert timeline == []
-
-    def test_sorted_output(self) -> None:
-        items = [
-            _make_item("b", start_ms=5000, end_ms=8000),
-            _make_item("a", start_ms=1000, end_ms=3000),
-        ]
-        items_by_id = {i.id: i for i in items}
-        # Pass in reverse order
-        timeline = _derive_timeline(["b", "a"], items_by_id)
-        assert timeline[0].start_ms == 1000
-        assert timeline[1].start_ms == 5000
+class TestDeriveTimeline:
+    @pytest.mark.parametrize(
+        ("ids", "shape", "expected"),
+        [
+            pytest.param(["a"], "a_only", [(1000, 5000)], id="single_item"),
+            pytest.param(
+                ["a", "b"], "ab_nonoverlap", [(1000, 3000), (5000, 8000)], id="non_overlapping"
+            ),
+            pytest.param(["a", "b"], "ab_overlap", [(1000, 8000)], id="overlapping_merged"),
+            pytest.param(["a", "b"], "ab_adjacent", [(1000, 5000)], id="adjacent_merged"),
+            pytest.param(["a", "nonexistent"], "a_only", [(1000, 5000)], id="unknown_ids_ignored"),
+            pytest.param([], "empty", [], id="empty_ids"),
+            pytest.param(
+                ["b", "a"], "ab_nonoverlap", [(1000, 3000), (5000, 8000)], id="sorted_output"
+            ),
+        ],
+    )
+    def test_derive_timeline(
+        self,
+        shapes: dict[str, dict[str, ExtractedItem]],
+        ids: list[str],
+        shape: str,
+        expected: list[tuple[int, int]],
+    ) -> None:
+        timeline = _derive_timeline(ids, shapes[shape])
+        assert [(span.start_ms, span.end_ms) for span in timeline] == expected
 
 
 # ---------------------------------------------------------------------------
@@ -144,14 +138,13 @@ class TestDeriveTimeline:
 
 
 class TestParseTopicThreads:
-    def test_valid_response(self) -> None:
-        raw = (FIXTURES_DIR / "topics_valid.json").read_text()
+    def test_valid_response(self, topics_valid_json: str) -> None:
         items = [
             _make_item("item_1", start_ms=3000, end_ms=6500),
             _make_item("item_2", start_ms=6500, end_ms=10000),
             _make_item("item_3", start_ms=10000, end_ms=14000),
         ]
-        threads = _parse_topic_threads(raw, items)
+        threads = _parse_topic_threads(topics_valid_json, items)
         assert len(threads) == 2
         assert threads[0].label == "python_data_classes"
         assert threads[0].item_ids == ["item_1", "item_2"]
@@ -213,9 +206,8 @@ class TestParseTopicThreads:
         assert len(threads) == 1
         assert threads[0].label == "good"
 
-    def test_markdown_fences_stripped(self) -> None:
-        raw = (FIXTURES_DIR / "topics_valid.json").read_text()
-        fenced = f"```json\n{raw}\n```"
+    def test_markdown_fences_stripped(self, topics_valid_json: str) -> None:
+        fenced = f"```json\n{topics_valid_json}\n```"
         items = [
             _make_item("item_1", start_ms=3000, end_ms=6500),
             _make_item("item_2", start_ms=6500, end_ms=10000),
@@ -252,83 +244,85 @@ class TestParseTopicThreads:
 
 
 class TestClusterTopicThreads:
-    def test_successful_clustering(self) -> None:
-        fixture = (FIXTURES_DIR / "topics_valid.json").read_text()
-        mock_response = _mock_llm_response(fixture)
+    async def test_successful_clustering(self, config: AppConfig, topics_valid_json: str) -> None:
+        mock_response = _mock_llm_response(topics_valid_json)
 
-        with patch("yt_factify.llm.litellm") as mock_litellm:
+        with patch.object(llm_mod, "litellm") as mock_litellm:
             mock_litellm.acompletion = AsyncMock(return_value=mock_response)
 
-            config = _make_config()
             items = [
                 _make_item("item_1", start_ms=3000, end_ms=6500),
                 _make_item("item_2", start_ms=6500, end_ms=10000),
                 _make_item("item_3", start_ms=10000, end_ms=14000),
             ]
-            result = asyncio.run(cluster_topic_threads(items, config))
+            result = await cluster_topic_threads(items, config)
 
             assert len(result) == 2
             assert result[0].label == "python_data_classes"
             mock_litellm.acompletion.assert_called_once()
 
-    def test_few_items_returns_empty(self) -> None:
-        config = _make_config()
+    async def test_few_items_returns_empty(self, config: AppConfig) -> None:
         items = [_make_item("item_1"), _make_item("item_2")]
-        result = asyncio.run(cluster_topic_threads(items, config))
+        result = await cluster_topic_threads(items, config)
         assert result == []
 
-    def test_zero_items_returns_empty(self) -> None:
-        config = _make_config()
-        result = asyncio.run(cluster_topic_threads([], config))
+    async def test_zero_items_returns_empty(self, config: AppConfig) -> None:
+        result = await cluster_topic_threads([], config)
         assert result == []
 
-    def test_retry_on_malformed_json(self) -> None:
-        bad_response = _mock_llm_response("not json")
-        fixture = (FIXTURES_DIR / "topics_valid.json").read_text()
-        good_response = _mock_llm_response(fixture)
+    async def test_retry_on_malformed_json(
+        self, config: AppConfig, topics_valid_json: str
+    ) -> None:
+        responses = iter(
+            [_mock_llm_response("not json"), _mock_llm_response(topics_valid_json)],
+        )
+        call_count = 0
+
+        async def acompletion(**kwargs: object) -> SimpleNamespace:
+            nonlocal call_count
+            call_count += 1
+            return next(responses)
 
-        with patch("yt_factify.llm.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(side_effect=[bad_response, good_response])
+        with patch.object(llm_mod, "litellm") as mock_litellm:
+            mock_litellm.acompletion = acompletion
 
-            config = _make_config()
             items = [
                 _make_item("item_1", start_ms=3000, end_ms=6500),
                 _make_item("item_2", start_ms=6500, end_ms=10000),
                 _make_item("item_3", start_ms=10000, end_ms=14000),
             ]
-            result = asyncio.run(cluster_topic_threads(items, config))
+            result = await cluster_topic_threads(items, config)
             assert len(result) == 2
-            assert mock_litellm.acompletion.call_count == 2
+            assert call_count == 2
 
-    def test_persistent_failure_raises(self) -> None:
+    async def test_persistent_failure_raises(self, config: AppConfig) -> None:
         bad_response = _mock_llm_response("not json")
 
-        with patch("yt_factify.llm.litellm") as mock_litellm:
+        with patch.object(llm_mod, "litellm") as mock_litellm:
             mock_litellm.acompletion = AsyncMock(return_value=bad_response)
 
-            config = _make_config()
             items = [
                 _make_item("item_1"),
                 _make_item("item_2"),
                 _make_item("item_3"),
             ]
             with pytest.raises(TopicClusteringError, match="Failed to cluster"):
-                asyncio.run(cluster_topic_threads(items, config))
+                await cluster_topic_threads(items, config)
 
-    def test_prompt_contains_item_info(self) -> None:
-        fixture = (FIXTURES_DIR / "topics_valid.json").read_text()
-        mock_response = _mock_llm_response(fixture)
+    async def test_prompt_contains_item_info(
+        self, config: AppConfig, topics_valid_json: str
+    ) -> None:
+        mock_response = _mock_llm_response(topics_valid_json)
 
-        with patch("yt_factify.llm.litellm") as mock_litellm:
+        with patch.object(llm_mod, "litellm") as mock_litellm:
             mock_litellm.acompletion = AsyncMock(return_value=mock_response)
 
-            config = _make_config()
             items = [
                 _make_item("item_1", start_ms=3000, end_ms=6500),
                 _make_item("item_2", start_ms=6500, end_ms=10000),
                 _make_item("item_3", start_ms=10000, end_ms=14000),
             ]
-            asyncio.run(cluster_topic_threads(items, config))
+            await cluster_topic_threads(items, config)
 
             call_args = mock_litellm.acompletion.call_args
             messages = call_args.kwargs["messages"]
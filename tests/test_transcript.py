@@ -8,9 +8,11 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+from datetime import date, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
@@ -22,6 +24,9 @@ from yt_factify.models import (
     VideoMetadata,
 )
 from yt_factify.transcript import (
+    _HINT_NO_CAPTIONS,
+    _HINT_UPLOADED_RECENTLY,
+    _HINT_UPLOADED_TODAY,
     EmptyTranscriptError,
     TranscriptFetchError,
     _normalize_text,
@@ -34,6 +39,15 @@ from yt_factify.transcript import (
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "transcripts"
 
+# Fixed reference day for upload-date hints, so the recent-upload cases
+# don't depend on the wall clock or on a run crossing midnight.
+_TODAY = date(2026, 1, 1)
+_TODAY_ISO = _TODAY.isoformat()
+_THREE_DAYS_AGO_ISO = (_TODAY - timedelta(days=3)).isoformat()
+
+# hashlib.sha256(b"").hexdigest(); guarded by TestSha256.test_empty_string
+_EMPTY_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
 
 def _load_fixture(name: str) -> RawTranscript:
     """Load a transcript fixture JSON file into a RawTranscript."""
@@ -41,6 +55,18 @@ def _load_fixture(name: str) -> RawTranscript:
     return RawTranscript(**data)
 
 
+@pytest.fixture(scope="module")
+def short_tutorial() -> NormalizedTranscript:
+    """``short_tutorial.json`` normalized once per module."""
+    return normalize_transcript(_load_fixture("short_tutorial.json"))
+
+
+@pytest.fixture(scope="module")
+def long_interview() -> NormalizedTranscript:
+    """``long_interview.json`` normalized once per module."""
+    return normalize_transcript(_load_fixture("long_interview.json"))
+
+
 # ---------------------------------------------------------------------------
 # Normalization helpers
 # ---------------------------------------------------------------------------
@@ -73,6 +99,9 @@ class TestSha256:
     def test_different_inputs(self) -> None:
         assert _sha256("hello") != _sha256("world")
 
+    def test_empty_string(self) -> None:
+        assert _sha256("") == _EMPTY_SHA256
+
 
 # ---------------------------------------------------------------------------
 # normalize_transcript
@@ -80,32 +109,24 @@ class TestSha256:
 
 
 class TestNormalizeTranscript:
-    def test_short_tutorial(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        result = normalize_transcript(raw)
-        assert result.video_id == "tutorial123"
-        assert result.language == "en"
-        assert len(result.segments) == 8
-        assert result.hash  # non-empty hash
-        assert result.full_text  # non-empty full text
-
-    def test_long_interview(self) -> None:
-        raw = _load_fixture("long_interview.json")
-        result = normalize_transcript(raw)
-        assert result.video_id == "interview456"
-        assert len(result.segments) == 21
-
-    def test_per_segment_hashes_unique(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        result = normalize_transcript(raw)
-        hashes = [seg.hash for seg in result.segments]
+    def test_short_tutorial(self, short_tutorial: NormalizedTranscript) -> None:
+        assert short_tutorial.video_id == "tutorial123"
+        assert short_tutorial.language == "en"
+        assert len(short_tutorial.segments) == 8
+        assert short_tutorial.hash  # non-empty hash
+        assert short_tutorial.full_text  # non-empty full text
+
+    def test_long_interview(self, long_interview: NormalizedTranscript) -> None:
+        assert long_interview.video_id == "interview456"
+        assert len(long_interview.segments) == 21
+
+    def test_per_segment_hashes_unique(self, short_tutorial: NormalizedTranscript) -> None:
+        hashes = [seg.hash for seg in short_tutorial.segments]
         assert len(hashes) == len(set(hashes))
 
-    def test_full_text_is_joined_segments(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        result = normalize_transcript(raw)
-        expected = " ".join(seg.text for seg in result.segments)
-        assert result.full_text == expected
+    def test_full_text_is_joined_segments(self, short_tutorial: NormalizedTranscript) -> None:
+        expected = " ".join(seg.text for seg in short_tutorial.segments)
+        assert short_tutorial.full_text == expected
 
     def test_whitespace_normalization(self) -> None:
         raw = RawTranscript(
@@ -128,8 +149,8 @@ class TestNormalizeTranscript:
             ],
         )
         result = normalize_transcript(raw)
-        # Both should normalize to the same text
-        assert result.segments[0].text == result.segments[1].text
+        # Both should normalize to the precomposed (NFC) form
+        assert result.segments[0].text == "caf\u00e9" == result.segments[1].text
         assert result.segments[0].hash == result.segments[1].hash
 
     def test_empty_segments_raises(self) -> None:
@@ -155,60 +176,52 @@ class TestNormalizeTranscript:
 
 
 class TestSegmentTranscript:
-    def test_short_video_single_segment(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        normalized = normalize_transcript(raw)
+    def test_short_video_single_segment(self, short_tutorial: NormalizedTranscript) -> None:
         # 27s total, target 45s → single segment
-        segments = segment_transcript(normalized, target_seconds=45)
+        segments = segment_transcript(short_tutorial, target_seconds=45)
         assert len(segments) == 1
         assert segments[0].start_ms == 0
         assert segments[0].end_ms == 27000
         assert len(segments[0].source_segment_indices) == 8
 
-    def test_long_video_multiple_segments(self) -> None:
-        raw = _load_fixture("long_interview.json")
-        normalized = normalize_transcript(raw)
+    def test_long_video_multiple_segments(self, long_interview: NormalizedTranscript) -> None:
         # 85s total, target 45s → should produce 2 segments
-        segments = segment_transcript(normalized, target_seconds=45)
+        segments = segment_transcript(long_interview, target_seconds=45)
         assert len(segments) == 2
         # First segment should cover roughly 45s
         assert segments[0].end_ms >= 40000
-        # All source indices should be covered
-        all_indices = []
-        for seg in segments:
-            all_indices.extend(seg.source_segment_indices)
-        assert sorted(all_indices) == list(range(len(normalized.segments)))
-
-    def test_each_segment_has_hash(self) -> None:
-        raw = _load_fixture("long_interview.json")
-        normalized = normalize_transcript(raw)
-        segments = segment_transcript(normalized, target_seconds=45)
-        for seg in segments:
-            assert seg.hash
-            assert len(seg.hash) == 64  # SHA-256 hex digest
-
-    def test_small_target_many_segments(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        normalized = normalize_transcript(raw)
+        # Every source index is covered exactly once, in order
+        all_indices = list(
+            itertools.chain.from_iterable(seg.source_segment_indices for seg in segments)
+        )
+        assert all_indices == list(range(len(long_interview.segments)))
+
+    def test_each_segment_has_hash(self, long_interview: NormalizedTranscript) -> None:
+        segments = segment_transcript(long_interview, target_seconds=45)
+        # One assertion over all segments; a failure lists the offending indices
+        bad = [i for i, seg in enumerate(segments) if len(seg.hash) != 64]  # SHA-256 hex
+        assert segments
+        assert bad == []
+
+    def test_small_target_many_segments(self, short_tutorial: NormalizedTranscript) -> None:
         # Very small target → more segments
-        segments = segment_transcript(normalized, target_seconds=5)
+        segments = segment_transcript(short_tutorial, target_seconds=5)
         assert len(segments) >= 3
 
     def test_empty_transcript_returns_empty(self) -> None:
-        nt = NormalizedTranscript(
+        # Plain pass-through input; skip validation of the known-good fields
+        nt = NormalizedTranscript.model_construct(
             video_id="empty",
             full_text="",
-            hash=_sha256(""),
+            hash=_EMPTY_SHA256,
             segments=[],
         )
         assert segment_transcript(nt) == []
 
-    def test_segment_text_combines_sources(self) -> None:
-        raw = _load_fixture("short_tutorial.json")
-        normalized = normalize_transcript(raw)
-        segments = segment_transcript(normalized, target_seconds=45)
+    def test_segment_text_combines_sources(self, short_tutorial: NormalizedTranscript) -> None:
+        segments = segment_transcript(short_tutorial, target_seconds=45)
         # Single segment should contain all text
-        for norm_seg in normalized.segments:
+        for norm_seg in short_tutorial.segments:
             assert norm_seg.text in segments[0].text
 
 
@@ -217,166 +230,145 @@ class TestSegmentTranscript:
 # ---------------------------------------------------------------------------
 
 
+def _fetch_result(
+    *segments: tuple[str, float, float],
+    success: bool = True,
+    errors: list[str] | None = None,
+    language: str = "en",
+    metadata: SimpleNamespace | None = None,
+) -> SimpleNamespace:
+    """Build a yt-fetch ``FetchResult`` stand-in from ``(text, start, duration)`` tuples.
+
+    With no segments the result carries no transcript at all.
+    """
+    transcript = None
+    if segments:
+        transcript = SimpleNamespace(
+            segments=[
+                SimpleNamespace(text=text, start=start, duration=duration)
+                for text, start, duration in segments
+            ],
+            language=language,
+        )
+    return SimpleNamespace(
+        success=success,
+        transcript=transcript,
+        errors=errors or [],
+        metadata=metadata,
+    )
+
+
+@pytest.fixture(scope="module")
+def config() -> AppConfig:
+    """A default AppConfig shared by the fetch tests; none of them mutate it."""
+    return AppConfig()
+
+
+@pytest.fixture
+def fake_yt_fetch() -> SimpleNamespace:
+    """A plain stand-in for the ``yt_fetch`` module, passed to ``fetch_transcript``.
+
+    Tests set ``result`` to the value ``fetch_video`` should return;
+    ``options`` records the keyword arguments of the last ``FetchOptions``
+    call.
+    """
+    fake = SimpleNamespace(result=None, options=None)
+
+    def fetch_options(**kwargs: object) -> dict[str, object]:
+        fake.options = kwargs
+        return kwargs
+
+    fake.FetchOptions = fetch_options
+    fake.fetch_video = lambda _video_id, _opts: fake.result
+    return fake
+
+
 class TestFetchTranscript:
-    def test_successful_fetch(self) -> None:
-        mock_segment = MagicMock()
-        mock_segment.text = "Hello world"
-        mock_segment.start = 0.0
-        mock_segment.duration = 5.0
-
-        mock_transcript = MagicMock()
-        mock_transcript.segments = [mock_segment]
-        mock_transcript.language = "en"
-
-        mock_result = MagicMock()
-        mock_result.success = True
-        mock_result.transcript = mock_transcript
-        mock_result.errors = []
-        mock_result.metadata = None
-
-        mock_yt_fetch = MagicMock()
-        mock_yt_fetch.fetch_video.return_value = mock_result
-        mock_yt_fetch.FetchOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"yt_fetch": mock_yt_fetch}):
-            config = AppConfig()
-            result = fetch_transcript("test123", config)
-            assert result.video_id == "test123"
-            assert len(result.segments) == 1
-            assert result.segments[0].text == "Hello world"
-            assert result.segments[0].start_ms == 0
-            assert result.segments[0].end_ms == 5000
-            assert result.language == "en"
-            assert result.metadata is None
-
-    def test_failed_fetch_raises(self) -> None:
-        mock_result = MagicMock()
-        mock_result.success = False
-        mock_result.transcript = None
-        mock_result.errors = ["Video not found"]
-        mock_result.metadata = None
-
-        mock_yt_fetch = MagicMock()
-        mock_yt_fetch.fetch_video.return_value = mock_result
-        mock_yt_fetch.FetchOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"yt_fetch": mock_yt_fetch}):
-            config = AppConfig()
-            with pytest.raises(TranscriptFetchError, match="Video not found"):
-                fetch_transcript("bad_id", config)
-
-    def test_no_transcript_raises(self) -> None:
-        mock_result = MagicMock()
-        mock_result.success = True
-        mock_result.transcript = None
-        mock_result.errors = []
-        mock_result.metadata = None
-
-        mock_yt_fetch = MagicMock()
-        mock_yt_fetch.fetch_video.return_value = mock_result
-        mock_yt_fetch.FetchOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"yt_fetch": mock_yt_fetch}):
-            config = AppConfig()
-            with pytest.raises(TranscriptFetchError):
-                fetch_transcript("no_transcript", config)
-
-    def test_metadata_passthrough(self) -> None:
-        mock_segment = MagicMock()
-        mock_segment.text = "Hello"
-        mock_segment.start = 0.0
-        mock_segment.duration = 5.0
-
-        mock_transcript = MagicMock()
-        mock_transcript.segments = [mock_segment]
-        mock_transcript.language = "en"
-
-        mock_metadata = MagicMock()
-        mock_metadata.title = "Test Video"
-        mock_metadata.channel_id = "UC123"
-        mock_metadata.channel_title = "Test Channel"
-        mock_metadata.upload_date = "2025-06-15"
-        mock_metadata.duration_seconds = 120.0
-        mock_metadata.fetched_at = "2025-06-15T12:00:00Z"
-
-        mock_result = MagicMock()
-        mock_result.success = True
-        mock_result.transcript = mock_transcript
-        mock_result.errors = []
-        mock_result.metadata = mock_metadata
-
-        mock_yt_fetch = MagicMock()
-        mock_yt_fetch.fetch_video.return_value = mock_result
-        mock_yt_fetch.FetchOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"yt_fetch": mock_yt_fetch}):
-            config = AppConfig()
-            result = fetch_transcript("test123", config)
-            assert result.metadata is not None
-            assert result.metadata.title == "Test Video"
-            assert result.metadata.channel_id == "UC123"
-            assert result.metadata.channel_title == "Test Channel"
-            assert result.metadata.upload_date == "2025-06-15"
-            assert result.metadata.duration_seconds == 120.0
-
-    def test_configurable_languages(self) -> None:
-        mock_segment = MagicMock()
-        mock_segment.text = "Bonjour"
-        mock_segment.start = 0.0
-        mock_segment.duration = 3.0
-
-        mock_transcript = MagicMock()
-        mock_transcript.segments = [mock_segment]
-        mock_transcript.language = "fr"
-
-        mock_result = MagicMock()
-        mock_result.success = True
-        mock_result.transcript = mock_transcript
-        mock_result.errors = []
-        mock_result.metadata = None
-
-        mock_yt_fetch = MagicMock()
-        mock_yt_fetch.fetch_video.return_value = mock_result
-        mock_yt_fetch.FetchOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"yt_fetch": mock_yt_fetch}):
-            config = AppConfig(languages=["fr"])
-            result = fetch_transcript("french_vid", config)
-            assert result.language == "fr"
-            # Verify FetchOptions was called with the right languages
-            call_kwargs = mock_yt_fetch.FetchOptions.call_args
-            assert call_kwargs.kwargs["languages"] == ["fr"]
+    def test_successful_fetch(self, config: AppConfig, fake_yt_fetch: SimpleNamespace) -> None:
+        fake_yt_fetch.result = _fetch_result(("Hello world", 0.0, 5.0))
+
+        result = fetch_transcript("test123", config, yt_fetch=fake_yt_fetch)
+        assert result.video_id == "test123"
+        assert len(result.segments) == 1
+        assert result.segments[0].text == "Hello world"
+        assert result.segments[0].start_ms == 0
+        assert result.segments[0].end_ms == 5000
+        assert result.language == "en"
+        assert result.metadata is None
+
+    def test_failed_fetch_raises(self, config: AppConfig, fake_yt_fetch: SimpleNamespace) -> None:
+        fake_yt_fetch.result = _fetch_result(success=False, errors=["Video not found"])
+
+        with pytest.raises(TranscriptFetchError, match="Video not found"):
+            fetch_transcript("bad_id", config, yt_fetch=fake_yt_fetch)
+
+    def test_no_transcript_raises(self, config: AppConfig, fake_yt_fetch: SimpleNamespace) -> None:
+        fake_yt_fetch.result = _fetch_result()
+
+        with pytest.raises(TranscriptFetchError):
+            fetch_transcript(
+                "no_transcript", config, yt_fetch=fake_yt_fetch, sleep=lambda _s: None
+            )
+
+    def test_metadata_passthrough(self, config: AppConfig, fake_yt_fetch: SimpleNamespace) -> None:
+        fake_yt_fetch.result = _fetch_result(
+            ("Hello", 0.0, 5.0),
+            metadata=SimpleNamespace(
+                title="Test Video",
+                channel_id="UC123",
+                channel_title="Test Channel",
+                upload_date="2025-06-15",
+                duration_seconds=120.0,
+                fetched_at="2025-06-15T12:00:00Z",
+            ),
+        )
+
+        result = fetch_transcript("test123", config, yt_fetch=fake_yt_fetch)
+        assert result.metadata is not None
+        assert result.metadata.title == "Test Video"
+        assert result.metadata.channel_id == "UC123"
+        assert result.metadata.channel_title == "Test Channel"
+        assert result.metadata.upload_date == "2025-06-15"
+        assert result.metadata.duration_seconds == 120.0
+
+    def test_configurable_languages(self, fake_yt_fetch: SimpleNamespace) -> None:
+        fake_yt_fetch.result = _fetch_result(("Bonjour", 0.0, 3.0), language="fr")
+
+        config = AppConfig(languages=["fr"])
+        result = fetch_transcript("french_vid", config, yt_fetch=fake_yt_fetch)
+        assert result.language == "fr"
+        # Verify FetchOptions was called with the right languages
+        assert fake_yt_fetch.options["languages"] == ["fr"]
 
 
 class TestUploadDateHint:
     def test_no_metadata(self) -> None:
-        assert "may lack captions" in _upload_date_hint(None)
+        assert _upload_date_hint(None) == _HINT_NO_CAPTIONS
 
     def test_no_upload_date(self) -> None:
         meta = VideoMetadata()
-        assert "may lack captions" in _upload_date_hint(meta)
+        assert _upload_date_hint(meta) == _HINT_NO_CAPTIONS
 
     def test_invalid_upload_date(self) -> None:
         meta = VideoMetadata(upload_date="not-a-date")
-        assert "may lack captions" in _upload_date_hint(meta)
+        assert _upload_date_hint(meta) == _HINT_NO_CAPTIONS
 
     def test_recent_upload_under_24h(self) -> None:
-        from datetime import date
-
-        today = date.today().isoformat()
-        meta = VideoMetadata(upload_date=today)
-        hint = _upload_date_hint(meta)
-        assert "within the last 24 hours" in hint
+        meta = VideoMetadata(upload_date=_TODAY_ISO)
+        hint = _upload_date_hint(meta, today=_TODAY)
+        assert hint == _HINT_UPLOADED_TODAY
 
     def test_recent_upload_within_week(self) -> None:
-        from datetime import date, timedelta
-
-        three_days_ago = (date.today() - timedelta(days=3)).isoformat()
-        meta = VideoMetadata(upload_date=three_days_ago)
-        hint = _upload_date_hint(meta)
-        assert "uploaded recently" in hint
+        meta = VideoMetadata(upload_date=_THREE_DAYS_AGO_ISO)
+        hint = _upload_date_hint(meta, today=_TODAY)
+        assert hint == _HINT_UPLOADED_RECENTLY
 
     def test_old_upload(self) -> None:
         meta = VideoMetadata(upload_date="2020-01-01")
-        hint = _upload_date_hint(meta)
-        assert "may lack captions" in hint
+        hint = _upload_date_hint(meta, today=_TODAY)
+        assert hint == _HINT_NO_CAPTIONS
+
+    def test_hint_wording(self) -> None:
+        assert "may lack captions" in _HINT_NO_CAPTIONS
+        assert "within the last 24 hours" in _HINT_UPLOADED_TODAY
+        assert "uploaded recently" in _HINT_UPLOADED_RECENTLY
@@ -8,6 +8,10 @@
 
 from __future__ import annotations
 
+import functools
+
+import pytest
+
 from yt_factify.config import AppConfig
 from yt_factify.models import (
     ExtractedItem,
@@ -21,6 +25,7 @@ from yt_factify.validation import (
     _check_timestamp_bounds,
     validate_items,
     verify_quote,
+    verify_quotes_batch,
 )
 
 
@@ -64,6 +69,7 @@ def _make_transcript() -> NormalizedTranscript:
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _make_item(
     item_id: str = "item_1",
     item_type: ItemType = ItemType.TRANSCRIPT_FACT,
@@ -85,75 +91,95 @@ def _make_item(
     )
 
 
+@functools.cache
 def _make_config(
     quote_mismatch: QuoteMismatchBehavior = QuoteMismatchBehavior.REJECT,
 ) -> AppConfig:
     return AppConfig(model="test", quote_mismatch=quote_mismatch)
 
 
+@pytest.fixture(scope="module")
+def transcript() -> NormalizedTranscript:
+    """The sample transcript, built once per module; no test mutates it."""
+    return _make_transcript()
+
+
 # ---------------------------------------------------------------------------
 # verify_quote
 # ---------------------------------------------------------------------------
 
 
-class TestVerifyQuote:
-    def test_exact_match_in_segment(self) -> None:
-        transcript = _make_transcript()
-        assert verify_quote(
-            "Data classes were introduced in Python 3.7.",
-            transcript,
-            start_ms=3000,
-            end_ms=6500,
-        )
+_QUOTE = "Data classes were introduced in Python 3.7."
 
-    def test_substring_match(self) -> None:
-        transcript = _make_transcript()
-        assert verify_quote(
-            "introduced in Python 3.7",
-            transcript,
-            start_ms=3000,
-            end_ms=6500,
-        )
 
-    def test_no_match(self) -> None:
-        transcript = _make_transcript()
-        assert not verify_quote(
-            "This text does not exist in the transcript",
-            transcript,
-            start_ms=3000,
-            end_ms=6500,
-        )
+class TestVerifyQuote:
+    @pytest.mark.parametrize(
+        ("quote", "start_ms", "end_ms", "expected"),
+        [
+            pytest.param(_QUOTE, 3000, 6500, True, id="exact_match_in_segment"),
+            pytest.param("introduced in Python 3.7", 3000, 6500, True, id="substring_match"),
+            pytest.param(
+                "This text does not exist in the transcript", 3000, 6500, False, id="no_match"
+            ),
+            # The quote is at 3000-6500, but the search window is 0-3000
+            pytest.param(_QUOTE, 0, 3000, False, id="match_outside_time_range"),
+            # Window covers segments 2 and 3: "Data classes... They reduce..."
+            pytest.param(_QUOTE, 3000, 10000, True, id="match_spanning_segments"),
+            # Empty string is a substring of everything
+            pytest.param("", 0, 14000, True, id="empty_quote"),
+            # Time range beyond the transcript
+            pytest.param("anything", 20000, 25000, False, id="no_overlapping_segments"),
+        ],
+    )
+    def test_verify_quote(
+        self,
+        transcript: NormalizedTranscript,
+        quote: str,
+        start_ms: int,
+        end_ms: int,
+        expected: bool,
+    ) -> None:
+        assert verify_quote(quote, transcript, start_ms=start_ms, end_ms=end_ms) is expected
+
+
+class TestVerifyQuotesBatch:
+    @pytest.mark.parametrize("n_quotes", [1, 100, 10_000])
+    def test_matches_verify_quote(self, transcript: NormalizedTranscript, n_quotes: int) -> None:
+        cases = [
+            (_QUOTE, (3000, 6500)),
+            ("introduced in Python 3.7", (3000, 6500)),
+            (_QUOTE, (0, 3000)),
+            (_QUOTE, (3000, 10000)),
+            ("boilerplate code significantly. Let me", (6500, 14000)),
+            ("anything", (20000, 25000)),
+        ]
+        quotes = [cases[i % len(cases)][0] for i in range(n_quotes)]
+        ranges = [cases[i % len(cases)][1] for i in range(n_quotes)]
+        expected = [
+            verify_quote(q, transcript, start_ms=s, end_ms=e)
+            for q, (s, e) in zip(quotes, ranges, strict=True)
+        ]
+        assert verify_quotes_batch(quotes, transcript, ranges) == expected
 
-    def test_match_outside_time_range(self) -> None:
-        transcript = _make_transcript()
-        # "Data classes..." is at 3000-6500, but we search 0-3000
-        assert not verify_quote(
-            "Data classes were introduced in Python 3.7.",
-            transcript,
-            start_ms=0,
-            end_ms=3000,
+    def test_unordered_segments_fall_back_to_scan(self) -> None:
+        transcript = NormalizedTranscript(
+            video_id="v",
+            full_text="later earlier",
+            hash="h",
+            segments=[
+                NormalizedSegment(text="later", start_ms=5000, end_ms=9000, hash="a"),
+                NormalizedSegment(text="earlier", start_ms=0, end_ms=4000, hash="b"),
+            ],
         )
-
-    def test_match_spanning_segments(self) -> None:
-        transcript = _make_transcript()
-        # Search across segments 2 and 3 (3000-10000)
-        # Combined text: "Data classes... They reduce..."
-        assert verify_quote(
-            "Data classes were introduced in Python 3.7.",
+        assert verify_quotes_batch(
+            ["earlier", "later", "later earlier"],
             transcript,
-            start_ms=3000,
-            end_ms=10000,
-        )
-
-    def test_empty_quote(self) -> None:
-        transcript = _make_transcript()
-        # Empty string is a substring of everything
-        assert verify_quote("", transcript, start_ms=0, end_ms=14000)
+            [(0, 4000), (5000, 9000), (0, 9000)],
+        ) == [True, True, True]
 
-    def test_no_overlapping_segments(self) -> None:
-        transcript = _make_transcript()
-        # Time range beyond transcript
-        assert not verify_quote("anything", transcript, start_ms=20000, end_ms=25000)
+    def test_length_mismatch_raises(self, transcript: NormalizedTranscript) -> None:
+        with pytest.raises(ValueError, match="2 quotes but 1 ranges"):
+            verify_quotes_batch(["a", "b"], transcript, [(0, 1000)])
 
 
 # ---------------------------------------------------------------------------
@@ -162,37 +188,27 @@ class TestVerifyQuote:
 
 
 class TestCheckTimestampBounds:
-    def test_valid_bounds(self) -> None:
-        transcript = _make_transcript()
-        item = _make_item(start_ms=3000, end_ms=6500)
-        assert _check_timestamp_bounds(item, transcript)
-
-    def test_negative_start(self) -> None:
-        transcript = _make_transcript()
-        item = _make_item(start_ms=-100, end_ms=6500)
-        assert not _check_timestamp_bounds(item, transcript)
-
-    def test_start_equals_end(self) -> None:
-        transcript = _make_transcript()
-        item = _make_item(start_ms=3000, end_ms=3000)
-        assert not _check_timestamp_bounds(item, transcript)
-
-    def test_start_after_end(self) -> None:
-        transcript = _make_transcript()
-        item = _make_item(start_ms=6500, end_ms=3000)
-        assert not _check_timestamp_bounds(item, transcript)
-
-    def test_beyond_transcript_end(self) -> None:
-        transcript = _make_transcript()
-        item = _make_item(start_ms=10000, end_ms=20000)
-        assert not _check_timestamp_bounds(item, transcript)
-
-    def test_before_transcript_start(self) -> None:
-        transcript = _make_transcript()
-        # Transcript starts at 0, but if segments started later...
-        # Our transcript starts at 0 so this is fine
-        item = _make_item(start_ms=0, end_ms=3000)
-        assert _check_timestamp_bounds(item, transcript)
+    @pytest.mark.parametrize(
+        ("start_ms", "end_ms", "expected"),
+        [
+            pytest.param(3000, 6500, True, id="valid_bounds"),
+            pytest.param(-100, 6500, False, id="negative_start"),
+            pytest.param(3000, 3000, False, id="start_equals_end"),
+            pytest.param(6500, 3000, False, id="start_after_end"),
+            pytest.param(10000, 20000, False, id="beyond_transcript_end"),
+            # The transcript starts at 0, so a span starting there is in bounds
+            pytest.param(0, 3000, True, id="at_transcript_start"),
+        ],
+    )
+    def test_bounds(
+        self,
+        transcript: NormalizedTranscript,
+        start_ms: int,
+        end_ms: int,
+        expected: bool,
+    ) -> None:
+        item = _make_item(start_ms=start_ms, end_ms=end_ms)
+        assert _check_timestamp_bounds(item, transcript) is expected
 
     def test_empty_transcript(self) -> None:
         transcript = NormalizedTranscript(
@@ -209,92 +225,87 @@ class TestCheckTimestampBounds:
 # validate_items
 # ---------------------------------------------------------------------------
 
+_MISSING_QUOTE = "This quote does not exist in the transcript."
 
-class TestValidateItems:
-    def test_valid_transcript_fact_accepted(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        item = _make_item()
-        result = validate_items([item], transcript, config)
-        assert len(result.accepted) == 1
-        assert len(result.rejected) == 0
-        assert len(result.downgraded) == 0
-
-    def test_valid_direct_quote_accepted(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        item = _make_item(
-            item_type=ItemType.DIRECT_QUOTE,
-            content="Data classes were introduced in Python 3.7.",
-        )
-        result = validate_items([item], transcript, config)
-        assert len(result.accepted) == 1
-
-    def test_quote_mismatch_reject_mode(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config(
-            quote_mismatch=QuoteMismatchBehavior.REJECT,
-        )
-        item = _make_item(
-            item_type=ItemType.DIRECT_QUOTE,
-            content="This quote does not exist in the transcript.",
-            evidence_text="Data classes were introduced in Python 3.7.",
-        )
-        result = validate_items([item], transcript, config)
-        assert len(result.accepted) == 0
-        assert len(result.rejected) == 1
-        assert len(result.downgraded) == 0
 
-    def test_quote_mismatch_downgrade_mode(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config(
-            quote_mismatch=QuoteMismatchBehavior.DOWNGRADE,
-        )
-        item = _make_item(
-            item_type=ItemType.DIRECT_QUOTE,
-            content="This quote does not exist in the transcript.",
-            evidence_text="Data classes were introduced in Python 3.7.",
-        )
+class TestValidateItems:
+    @pytest.mark.parametrize(
+        ("item_kwargs", "quote_mismatch", "expected_bucket"),
+        [
+            pytest.param({}, QuoteMismatchBehavior.REJECT, "accepted", id="valid_fact"),
+            pytest.param(
+                {"item_type": ItemType.DIRECT_QUOTE},
+                QuoteMismatchBehavior.REJECT,
+                "accepted",
+                id="valid_direct_quote",
+            ),
+            pytest.param(
+                {"item_type": ItemType.DIRECT_QUOTE, "content": _MISSING_QUOTE},
+                QuoteMismatchBehavior.REJECT,
+                "rejected",
+                id="quote_mismatch_reject_mode",
+            ),
+            pytest.param(
+                {"item_type": ItemType.DIRECT_QUOTE, "content": _MISSING_QUOTE},
+                QuoteMismatchBehavior.DOWNGRADE,
+                "downgraded",
+                id="quote_mismatch_downgrade_mode",
+            ),
+            pytest.param(
+                {"start_ms": 50000, "end_ms": 60000},
+                QuoteMismatchBehavior.REJECT,
+                "rejected",
+                id="invalid_timestamps",
+            ),
+            # speaker_opinion doesn't need quote verification
+            pytest.param(
+                {
+                    "item_type": ItemType.SPEAKER_OPINION,
+                    "content": "I think Python is the best language.",
+                },
+                QuoteMismatchBehavior.REJECT,
+                "accepted",
+                id="non_quote_skips_quote_check",
+            ),
+            # Non-quote item but evidence text doesn't match transcript
+            pytest.param(
+                {
+                    "content": "Some fact",
+                    "evidence_text": "This evidence text is not in the transcript.",
+                },
+                QuoteMismatchBehavior.REJECT,
+                "rejected",
+                id="evidence_text_mismatch",
+            ),
+        ],
+    )
+    def test_single_item_bucket(
+        self,
+        transcript: NormalizedTranscript,
+        item_kwargs: dict[str, object],
+        quote_mismatch: QuoteMismatchBehavior,
+        expected_bucket: str,
+    ) -> None:
+        item = _make_item(**item_kwargs)  # type: ignore[arg-type]
+        result = validate_items([item], transcript, _make_config(quote_mismatch))
+        buckets = {
+            "accepted": result.accepted,
+            "rejected": result.rejected,
+            "downgraded": result.downgraded,
+        }
+        assert {name: len(items) for name, items in buckets.items()} == {
+            name: int(name == expected_bucket) for name in buckets
+        }
+
+    def test_downgraded_quote_becomes_unverified_claim(
+        self, transcript: NormalizedTranscript
+    ) -> None:
+        item = _make_item(item_type=ItemType.DIRECT_QUOTE, content=_MISSING_QUOTE)
+        config = _make_config(QuoteMismatchBehavior.DOWNGRADE)
         result = validate_items([item], transcript, config)
-        assert len(result.accepted) == 0
-        assert len(result.rejected) == 0
-        assert len(result.downgraded) == 1
         assert result.downgraded[0].type == ItemType.UNVERIFIED_CLAIM
 
-    def test_invalid_timestamps_rejected(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        item = _make_item(start_ms=50000, end_ms=60000)
-        result = validate_items([item], transcript, config)
-        assert len(result.rejected) == 1
-        assert len(result.accepted) == 0
-
-    def test_non_quote_items_skip_quote_check(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        # speaker_opinion doesn't need quote verification
-        item = _make_item(
-            item_type=ItemType.SPEAKER_OPINION,
-            content="I think Python is the best language.",
-            evidence_text="Data classes were introduced in Python 3.7.",
-        )
-        result = validate_items([item], transcript, config)
-        assert len(result.accepted) == 1
-
-    def test_evidence_text_mismatch_rejected(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        # Non-quote item but evidence text doesn't match transcript
-        item = _make_item(
-            item_type=ItemType.TRANSCRIPT_FACT,
-            content="Some fact",
-            evidence_text="This evidence text is not in the transcript.",
-        )
-        result = validate_items([item], transcript, config)
-        assert len(result.rejected) == 1
-
-    def test_multiple_items_mixed_results(self) -> None:
-        transcript = _make_transcript()
+    def test_multiple_items_mixed_results(self, transcript: NormalizedTranscript) -> None:
         config = _make_config()
         items = [
             # Valid fact
@@ -316,10 +327,8 @@ class TestValidateItems:
         assert len(result.rejected) == 1
         assert result.rejected[0].id == "bad_ts"
 
-    def test_empty_items_list(self) -> None:
-        transcript = _make_transcript()
-        config = _make_config()
-        result = validate_items([], transcript, config)
+    def test_empty_items_list(self, transcript: NormalizedTranscript) -> None:
+        result = validate_items([], transcript, _make_config())
         assert result.accepted == []
         assert result.rejected == []
         assert result.downgraded == []